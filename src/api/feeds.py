@@ -1104,9 +1104,14 @@ def update_feed(slug):
         if 'queue_priority' in updates and updates['queue_priority'] != podcast.get('queue_priority'):
             db.restamp_pending_priorities(podcast['id'], updates['queue_priority'] or 0)
 
+        # The saved upstream body belongs to the old source; episode
+        # lookups must not resolve against it once the feed is repointed.
+        if 'source_url' in updates:
+            get_storage().delete_original_rss(slug)
+
         # Invalidate feed cache since we modified a feed
         from main_app.feeds import invalidate_feed_cache
-        invalidate_feed_cache()
+        invalidate_feed_cache(slug)
 
         # Return updated feed data
         podcast = db.get_podcast_by_slug(slug)
@@ -1180,7 +1185,7 @@ def delete_feed(slug):
 
         # Invalidate feed cache since we deleted a feed
         from main_app.feeds import invalidate_feed_cache
-        invalidate_feed_cache()
+        invalidate_feed_cache(slug)
 
         # Delete files
         storage.cleanup_podcast_dir(slug)
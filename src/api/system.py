@@ -1,5 +1,6 @@
 """System routes: /health, /system/* endpoints."""
 import datetime
+import hashlib
 import logging
 import os
 import re
@@ -436,15 +437,28 @@ def _render_openapi_yaml(openapi_path_str: str, version: str) -> str:
     )
 
 
+@lru_cache(maxsize=1)
+def _openapi_etag(openapi_path_str: str, version: str) -> str:
+    """Strong ETag for the rendered document, hashed once per worker."""
+    content = _render_openapi_yaml(openapi_path_str, version)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
 @api.route('/openapi.yaml', methods=['GET'])
 def serve_openapi():
-    """Serve OpenAPI specification with dynamic version."""
+    """Serve OpenAPI specification with dynamic version.
+
+    Carries an ETag so Swagger UI reloads revalidate with a 304 instead of
+    re-downloading the spec.
+    """
     openapi_path = _ROOT_DIR / 'openapi.yaml'
     if not openapi_path.exists():
         abort(404)
     try:
         from utils.app_version import APP_VERSION
         content = _render_openapi_yaml(str(openapi_path), APP_VERSION)
-        return Response(content, mimetype='application/x-yaml')
+        response = Response(content, mimetype='application/x-yaml')
+        response.set_etag(_openapi_etag(str(openapi_path), APP_VERSION))
+        return response.make_conditional(request)
     except Exception:
         return send_file(openapi_path, mimetype='application/x-yaml')
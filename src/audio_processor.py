@@ -91,6 +91,10 @@ NORMALIZE_PRESETS = {
 }
 DEFAULT_NORMALIZE_INTENSITY = 'normal'
 
+# Dot-prefixed so a render written into an episodes directory never matches
+# the {episode_id}*.mp3 globs that enumerate served audio versions.
+_TEMP_PREFIX = '.render-'
+
 
 class AudioProcessor:
     def __init__(self, replace_audio_path: str = None, bitrate: str = '128k'):
@@ -173,11 +177,13 @@ class AudioProcessor:
                     pass
 
     def normalize_audio(self, input_path: str,
-                        intensity: str = DEFAULT_NORMALIZE_INTENSITY) -> Optional[str]:
+                        intensity: str = DEFAULT_NORMALIZE_INTENSITY,
+                        output_dir: Optional[str] = None) -> Optional[str]:
         """Run a second ffmpeg pass to even out loudness across an episode
         (lift quiet passages, tame loud peaks). Returns the path of a new
         normalized file on success, or None on failure. Caller is responsible
         for cleanup of the input when swapping in the returned path.
+        ``output_dir`` places the temp output; see process_episode.
 
         This is intentionally a SEPARATE invocation from remove_ads - fusing
         dynaudnorm into the cut filter graph would risk the cut behavior across
@@ -192,7 +198,9 @@ class AudioProcessor:
             logger.error(f"Normalize input not found: {input_path}")
             return None
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.normalized.mp3') as tmp:
+        with tempfile.NamedTemporaryFile(delete=False, dir=output_dir,
+                                         prefix=_TEMP_PREFIX,
+                                         suffix='.normalized.mp3') as tmp:
             output_path = tmp.name
 
         success = False
@@ -568,14 +576,21 @@ class AudioProcessor:
                 os.unlink(chapters_meta_path)
 
     def process_episode(self, input_path: str,
-                        ad_segments: List[Dict]) -> Optional[Tuple[str, List[Dict]]]:
+                        ad_segments: List[Dict],
+                        output_dir: Optional[str] = None) -> Optional[Tuple[str, List[Dict]]]:
         """Process episode audio to remove ads.
 
         Returns (output_path, applied_cuts) on success, None on failure.
         applied_cuts is the merged/filtered/end-trimmed list remove_ads cut,
         which downstream asset generation and timestamp mapping consume.
+
+        ``output_dir`` places the temp output (default: the system temp dir).
+        Pointing it at the episodes directory keeps the render on the same
+        filesystem as its final path, so the finalize move is a rename
+        instead of a full copy out of /tmp.
         """
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp:
+        with tempfile.NamedTemporaryFile(delete=False, dir=output_dir,
+                                         prefix=_TEMP_PREFIX, suffix='.mp3') as tmp:
             temp_output = tmp.name
 
         try:
@@ -305,6 +305,19 @@ RSS_REFRESH_INTERVAL = 900      # Seconds between RSS refreshes (15 min)
 # gates lastRefreshError on the threshold so the UI marker matches.
 FEED_REFRESH_FAILURE_ALERT_THRESHOLD = 3
 FEED_REFRESH_FAILURE_COUNT_INTERVAL = 600  # Seconds between counted failures
+# refresh_all_feeds pool: workers are almost entirely blocked on upstream
+# HTTP, so the pool scales with feed count up to the cap. Feeds sharing a
+# host (Megaphone, Simplecast, Libsyn, ...) are capped separately so one
+# pass does not hammer a single CDN into rate limiting us.
+FEED_REFRESH_MAX_WORKERS = 16
+FEED_REFRESH_MAX_PER_HOST = 4
+# Auto-process queue drainer polling. An empty queue is re-checked every
+# QUEUE_POLL_BASE_SECONDS. When a claimed episode cannot start because
+# another job holds the processing lock, the wait grows exponentially with
+# jitter (utils.retry.calculate_backoff) up to QUEUE_BUSY_POLL_MAX_SECONDS;
+# a successful start resets it.
+QUEUE_POLL_BASE_SECONDS = 30
+QUEUE_BUSY_POLL_MAX_SECONDS = 300
 
 # ============================================================
 # Text Pattern Matching Thresholds
@@ -132,6 +132,20 @@ class EpisodeMixin:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_episode_status(self, slug: str, episode_id: str) -> Optional[str]:
+        """Status of one episode, or None if it does not exist.
+
+        For pollers that only need the status: get_episode also pulls the
+        transcript, VTT, chapters and LLM prompt/response blobs.
+        """
+        row = self.get_connection().execute(
+            """SELECT e.status FROM episodes e
+               JOIN podcasts p ON e.podcast_id = p.id
+               WHERE p.slug = ? AND e.episode_id = ?""",
+            (slug, episode_id)
+        ).fetchone()
+        return row['status'] if row else None
+
     def get_episode_neighbors(self, slug: str, episode_id: str) -> Dict[str, Optional[Dict]]:
         """Adjacent episodes in the same feed, by the feed's default newest-first
         order. The total order is (COALESCE(published_at, created_at), id); `id`
@@ -114,6 +114,14 @@ class PodcastMixin:
         row = cursor.fetchone()
         return row['detection_mode'] if row else None
 
+    def get_podcast_last_checked_at(self, slug: str) -> Optional[str]:
+        """Per-feed last_checked_at column only, for the RSS freshness check."""
+        conn = self.get_connection()
+        cursor = conn.execute(
+            "SELECT last_checked_at FROM podcasts WHERE slug = ?", (slug,))
+        row = cursor.fetchone()
+        return row['last_checked_at'] if row else None
+
     def get_podcast_queue_priority(self, slug: str) -> Optional[int]:
         """Per-feed queue_priority column only, without the full get_podcast_by_slug join."""
         conn = self.get_connection()
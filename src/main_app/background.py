@@ -3,9 +3,17 @@ import logging
 import os
 import shutil
 import time
-
-from config import MAX_EPISODE_RETRIES, title_matches_skip_patterns
+from concurrent.futures import ThreadPoolExecutor
+
+from audio_processor import _TEMP_PREFIX as _RENDER_PREFIX
+from config import (
+    MAX_EPISODE_RETRIES,
+    QUEUE_BUSY_POLL_MAX_SECONDS,
+    QUEUE_POLL_BASE_SECONDS,
+    title_matches_skip_patterns,
+)
 from utils.constants import CANCELED_ERROR_MESSAGE, EpisodeStatus
+from utils.retry import calculate_backoff
 # Singletons are bound in main_app/__init__.py before this submodule
 # is loaded by the explicit `from main_app.background import ...` at
 # the bottom of that file, so the apparent circular import is safe.
@@ -27,6 +35,89 @@ def _run_tick(tick_fn, name):
         db.clear_leaked_transaction(refresh_logger, name)
 
 
+_ORPHAN_RMTREE_WORKERS = 4
+
+
+def _remove_orphan_dirs(orphans):
+    """Delete orphan podcast directories, several at a time.
+
+    A deleted podcast can leave thousands of cached audio files behind and
+    rmtree unlinks them one by one on the refresh thread. Separate
+    directories don't contend with each other, so they are removed in
+    parallel. The pool is drained before returning so no removal outlives
+    the cleanup pass.
+    """
+    for entry in orphans:
+        refresh_logger.warning(f"Removing orphan podcast directory: {entry.name}")
+    if len(orphans) == 1:
+        shutil.rmtree(orphans[0].path, ignore_errors=True)
+        return
+    if orphans:
+        with ThreadPoolExecutor(
+                max_workers=min(_ORPHAN_RMTREE_WORKERS, len(orphans))) as executor:
+            for entry in orphans:
+                executor.submit(shutil.rmtree, entry.path, ignore_errors=True)
+
+
+# Renders are written into podcasts/<slug>/episodes/ so finalize is a rename.
+# process_episode removes an unfinished one in its finally, but a SIGKILL,
+# OOM kill or worker timeout skips that and, unlike /tmp, the data volume
+# survives a restart. Only one episode processes at a time, so a render
+# outside the current job's feed is abandoned; the age floor covers a job
+# that starts between the lock check and the scan.
+_STALE_RENDER_SECONDS = 60 * 60
+
+
+def _remove_stale_renders(podcast_dirs):
+    """Delete abandoned .render-* files left in episode directories."""
+    from processing_queue import ProcessingQueue
+    current = ProcessingQueue().get_current()
+    busy_slug = current[0] if current else None
+    cutoff = time.time() - _STALE_RENDER_SECONDS
+    removed = 0
+    for entry in podcast_dirs:
+        if entry.name == busy_slug:
+            continue
+        episodes_dir = os.path.join(entry.path, 'episodes')
+        try:
+            with os.scandir(episodes_dir) as files:
+                stale = [f for f in files
+                         if f.name.startswith(_RENDER_PREFIX)
+                         and f.is_file(follow_symlinks=False)
+                         and f.stat(follow_symlinks=False).st_mtime < cutoff]
+        except FileNotFoundError:
+            continue
+        for f in stale:
+            try:
+                os.unlink(f.path)
+                removed += 1
+            except OSError as e:
+                refresh_logger.warning(f"Failed to remove stale render {f.path}: {e}")
+    if removed:
+        refresh_logger.info(f"Removed {removed} abandoned render file(s)")
+
+
+# The 6-hourly FTS rebuild runs here so a slow rebuild cannot hold up the
+# refresh thread that calls run_cleanup. One worker: rebuilds never overlap.
+_maintenance_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='maint')
+_index_rebuild = None
+
+
+def _rebuild_search_index():
+    """Rebuild the search index on the maintenance thread.
+
+    rebuild_search_index logs "Search index rebuilt with N items" itself,
+    so no duplicate log line is needed here. Only a successful rebuild is
+    stamped; a failed one is retried on the next cleanup pass.
+    """
+    try:
+        db.rebuild_search_index()
+        run_cleanup._last_index_rebuild = time.time()
+    except Exception as e:
+        refresh_logger.error(f"Search index rebuild failed: {e}")
+        db.clear_leaked_transaction(refresh_logger, 'search index rebuild')
+
+
 def run_cleanup():
     """Run episode cleanup based on retention period."""
     try:
@@ -39,29 +130,34 @@ def run_cleanup():
 
     # Clean orphan podcast directories (podcasts deleted from DB but directories remain)
     try:
-        valid_slugs = {p['slug'] for p in db.get_all_podcasts()}
+        # Slug-only read: get_all_podcasts aggregates every episode row.
+        valid_slugs = frozenset(p['slug'] for p in db.get_podcast_feed_urls())
         podcast_base = os.path.join(storage.data_dir, 'podcasts')
         if os.path.exists(podcast_base):
-            for slug in os.listdir(podcast_base):
-                if slug not in valid_slugs:
-                    orphan_path = os.path.join(podcast_base, slug)
-                    if os.path.isdir(orphan_path):
-                        refresh_logger.warning(f"Removing orphan podcast directory: {slug}")
-                        shutil.rmtree(orphan_path, ignore_errors=True)
+            # DirEntry.is_dir reads the dirent type, so no stat per child.
+            # Symlinks are skipped: rmtree refuses them anyway, and
+            # following one would stat outside the data dir.
+            with os.scandir(podcast_base) as entries:
+                podcast_dirs = [entry for entry in entries
+                                if entry.is_dir(follow_symlinks=False)]
+            orphans = [entry for entry in podcast_dirs
+                       if entry.name not in valid_slugs]
+            _remove_orphan_dirs(orphans)
+            try:
+                _remove_stale_renders(
+                    [entry for entry in podcast_dirs if entry.name in valid_slugs])
+            except Exception as e:
+                refresh_logger.error(f"Stale render cleanup failed: {e}")
     except Exception as e:
         refresh_logger.error(f"Orphan cleanup failed: {e}")
 
-    # Periodic search index rebuild (every 6 hours). rebuild_search_index
-    # logs "Search index rebuilt with N items" itself, so no duplicate log
-    # line is needed at this caller.
-    try:
-        last_rebuild = getattr(run_cleanup, '_last_index_rebuild', 0)
-        if time.time() - last_rebuild > 21600:
-            db.rebuild_search_index()
-            run_cleanup._last_index_rebuild = time.time()
-    except Exception as e:
-        refresh_logger.error(f"Search index rebuild failed: {e}")
-        db.clear_leaked_transaction(refresh_logger, 'search index rebuild')
+    # Periodic search index rebuild (every 6 hours), handed to the
+    # maintenance thread. Skipped while a previous rebuild is still running.
+    global _index_rebuild
+    last_rebuild = getattr(run_cleanup, '_last_index_rebuild', 0)
+    if (time.time() - last_rebuild > 21600
+            and (_index_rebuild is None or _index_rebuild.done())):
+        _index_rebuild = _maintenance_pool.submit(_rebuild_search_index)
 
 
 def background_rss_refresh():
@@ -108,17 +204,19 @@ def background_queue_processor():
 
     Uses shutdown_event for graceful shutdown support.
     """
-    from main_app.processing import start_background_processing
+    from main_app.processing import start_background_processing, wait_for_background_job
     from offline_queue import offline_queue_tick
     from processing_queue import ProcessingQueue
     refresh_logger.info("Auto-process queue processor started")
-    backoff_seconds = 30  # Initial backoff for busy queue
+    busy_attempts = 0  # Consecutive busy/already-processing claims
     orphan_check_interval = 0  # Counter for orphan check (every 10 iterations)
     while not shutdown_event.is_set():
         # Guard point for issue #566 (see Database.rollback_open_transaction).
         db.clear_leaked_transaction(refresh_logger, 'queue processor')
         try:
-            # Periodically check for orphaned queue items (every ~5 minutes)
+            # Periodically check for orphaned queue items: every 10 polls,
+            # so ~5 minutes on an idle queue and up to about an hour while
+            # busy claims back off toward QUEUE_BUSY_POLL_MAX_SECONDS.
             orphan_check_interval += 1
             if orphan_check_interval >= 10:
                 orphan_check_interval = 0
@@ -195,30 +293,34 @@ def background_queue_processor():
                     if started:
                         # Row was already claimed 'processing' by claim_next_queued_episode.
                         # Reset backoff on successful start
-                        backoff_seconds = 30
-                        # Wait for processing to complete (poll status).
+                        busy_attempts = 0
+                        # Wait for processing to complete. The worker thread
+                        # signals on exit, so a finished job is picked up at
+                        # once; the 10 s timeout keeps the orphan and
+                        # shutdown checks below running while it works.
                         # Cap at the hard timeout so this waiter outlives a slow
                         # but successful job when the user has raised the limit.
                         from processing_timeouts import get_hard_timeout
                         max_wait = get_hard_timeout()
                         waited = 0
+                        wait_started = time.monotonic()
                         queue = ProcessingQueue()
                         # Consecutive polls where the row says processing but no
                         # worker holds the lock. One poll of grace lets a job
                         # that just finished write its status first.
                         orphan_polls = 0
                         while waited < max_wait and not shutdown_event.is_set():
-                            shutdown_event.wait(timeout=10)
-                            waited += 10
-                            episode = db.get_episode(slug, episode_id)
-                            if episode and episode['status'] in ('processed', 'failed', 'permanently_failed', 'deferred'):
+                            wait_for_background_job(timeout=10)
+                            waited = int(time.monotonic() - wait_started)
+                            episode_status = db.get_episode_status(slug, episode_id)
+                            if episode_status in ('processed', 'failed', 'permanently_failed', 'deferred'):
                                 break
                             if queue.is_processing(slug, episode_id):
                                 orphan_polls = 0
                                 continue
                             orphan_polls += 1
                             if orphan_polls >= 2:
-                                row_status = episode.get('status') if episode else 'missing'
+                                row_status = episode_status or 'missing'
                                 refresh_logger.warning(
                                     f"[{slug}:{episode_id}] Row says {row_status} but no worker holds "
                                     f"the lock after {waited}s; treating as orphaned"
@@ -268,15 +370,21 @@ def background_queue_processor():
                         # Episode is already being processed elsewhere. Release our
                         # claim back to 'pending' so it is re-checked later, then wait.
                         db.update_queue_status(queue_id, 'pending')
-                        refresh_logger.info(f"[{slug}:{episode_id}] Already processing, waiting {backoff_seconds}s...")
+                        backoff_seconds = calculate_backoff(
+                            busy_attempts, base_delay=QUEUE_POLL_BASE_SECONDS,
+                            max_delay=QUEUE_BUSY_POLL_MAX_SECONDS)
+                        busy_attempts += 1
+                        refresh_logger.info(f"[{slug}:{episode_id}] Already processing, waiting {backoff_seconds:.0f}s...")
                         shutdown_event.wait(timeout=backoff_seconds)
-                        backoff_seconds = min(backoff_seconds * 2, 300)  # Max 5 minutes
                     else:
                         # Queue is busy with another episode, try again later with backoff
                         db.update_queue_status(queue_id, 'pending')  # Put back in queue
-                        refresh_logger.debug(f"[{slug}:{episode_id}] Queue busy, will retry in {backoff_seconds}s")
+                        backoff_seconds = calculate_backoff(
+                            busy_attempts, base_delay=QUEUE_POLL_BASE_SECONDS,
+                            max_delay=QUEUE_BUSY_POLL_MAX_SECONDS)
+                        busy_attempts += 1
+                        refresh_logger.debug(f"[{slug}:{episode_id}] Queue busy, will retry in {backoff_seconds:.0f}s")
                         shutdown_event.wait(timeout=backoff_seconds)
-                        backoff_seconds = min(backoff_seconds * 2, 300)  # Max 5 minutes
 
                 except Exception as e:
                     # Clear any leaked transaction before the status write so
@@ -286,8 +394,10 @@ def background_queue_processor():
                     refresh_logger.error(f"[{slug}:{episode_id}] Auto-process error: {e}")
 
             else:
-                # No queued episodes, wait before checking again
-                shutdown_event.wait(timeout=30)
+                # No queued episodes, wait before checking again. Fixed, not
+                # backed off: one leader polls, and a newly queued episode
+                # should not wait longer than this to be picked up.
+                shutdown_event.wait(timeout=QUEUE_POLL_BASE_SECONDS)
 
             # Periodically clean up completed queue items
             db.clear_completed_queue_items(older_than_hours=24)
@@ -313,61 +423,81 @@ def reset_stuck_processing_episodes():
     from processing_queue import ProcessingQueue
 
     conn = db.get_connection()
-    cursor = conn.execute(
+    # Stream the cursor and unpack positionally; the writes are batched
+    # after the loop, so nothing touches the connection mid-iteration.
+    stuck = conn.execute(
         """SELECT e.id, e.episode_id, e.retry_count, p.slug
            FROM episodes e
            JOIN podcasts p ON e.podcast_id = p.id
            WHERE e.status = 'processing'
              AND datetime(e.updated_at) < datetime('now', '-30 minutes')"""
     )
-    stuck = cursor.fetchall()
 
     # Age alone cannot distinguish a slow pass from a crash; the lock can. A row
     # is only written at start and at ad_detection_status, so a long
     # transcription looks stale while the job is very much alive.
     current = ProcessingQueue().get_current()
-    reset_count = 0
-    failed_count = 0
+    to_fail = []
+    to_reset = []
+    fail_details = []
+    reset_details = []
 
-    for row in stuck:
-        if current == (row['slug'], row['episode_id']):
+    for row_id, episode_id, retry_count, slug in stuck:
+        if current == (slug, episode_id):
             continue
 
-        current_retry_count = row['retry_count'] or 0
+        current_retry_count = retry_count or 0
+        detail = f"{slug}/{episode_id} (retry_count={current_retry_count})"
 
         if current_retry_count >= MAX_EPISODE_RETRIES:
             # Already exceeded retries from real failures - mark as permanently failed
-            refresh_logger.warning(
-                f"Marking episode as permanently_failed (retry_count={current_retry_count}): "
-                f"{row['slug']}/{row['episode_id']}"
-            )
-            conn.execute(
-                """UPDATE episodes SET
-                   status = 'permanently_failed',
-                   error_message = 'Exceeded retry limit after repeated processing failures'
-                   WHERE id = ?""",
-                (row['id'],)
-            )
-            failed_count += 1
+            to_fail.append((row_id,))
+            fail_details.append(detail)
         else:
             # Reset to pending without incrementing retry_count (orphan != failure)
-            refresh_logger.info(
-                f"Resetting stuck episode (no retry penalty, retry_count={current_retry_count}): "
-                f"{row['slug']}/{row['episode_id']}"
-            )
-            conn.execute(
-                """UPDATE episodes SET
-                   status = 'pending',
-                   error_message = 'Reset after worker crash (no retry penalty)'
-                   WHERE id = ?""",
-                (row['id'],)
-            )
-            reset_count += 1
-
-    conn.commit()
-
-    if reset_count or failed_count:
+            to_reset.append((row_id,))
+            reset_details.append(detail)
+
+    # One statement per outcome rather than per row; a crash can strand
+    # hundreds of rows. BEGIN IMMEDIATE takes the write lock up front, so
+    # a concurrent writer makes this wait on busy_timeout instead of
+    # failing the deferred-to-write lock upgrade mid-batch.
+    if to_fail or to_reset:
+        with db.transaction(immediate=True) as write_conn:
+            if to_fail:
+                write_conn.executemany(
+                    """UPDATE episodes SET
+                       status = 'permanently_failed',
+                       error_message = 'Exceeded retry limit after repeated processing failures'
+                       WHERE id = ?""",
+                    to_fail
+                )
+            if to_reset:
+                write_conn.executemany(
+                    """UPDATE episodes SET
+                       status = 'pending',
+                       error_message = 'Reset after worker crash (no retry penalty)'
+                       WHERE id = ?""",
+                    to_reset
+                )
+
+    # One line per outcome after the commit rather than one per row; a
+    # crash can strand hundreds of rows.
+    if fail_details:
+        refresh_logger.warning(
+            f"Marked {len(fail_details)} stuck episode(s) permanently_failed: "
+            f"{_summarize_details(fail_details)}"
+        )
+    if reset_details:
         refresh_logger.info(
-            f"Stuck episode cleanup: {reset_count} reset to pending, "
-            f"{failed_count} marked permanently_failed"
+            f"Reset {len(reset_details)} stuck episode(s) to pending (no retry penalty): "
+            f"{_summarize_details(reset_details)}"
         )
+
+
+def _summarize_details(details, limit=50):
+    """Join up to ``limit`` entries for a log line, noting how many were cut."""
+    shown = ', '.join(details[:limit])
+    if len(details) > limit:
+        shown += f" ... and {len(details) - limit} more"
+    return shown
@@ -4,7 +4,13 @@ import time
 
 
 class TTLCache:
-    """Simple thread-safe cache with time-to-live expiration."""
+    """Simple thread-safe cache with time-to-live expiration.
+
+    Every entry shares one TTL and ``set`` re-inserts at the end of the
+    dict, so insertion order is expiry order: eviction only ever looks at
+    the front. Uses ``time.monotonic()`` so wall-clock jumps cannot keep
+    entries alive or expire them early.
+    """
 
     def __init__(self, ttl_seconds: int = 30, max_size: int = 1024):
         self._cache = {}
@@ -17,7 +23,7 @@ class TTLCache:
         with self._lock:
             if key in self._cache:
                 value, expires = self._cache[key]
-                if time.time() < expires:
+                if time.monotonic() < expires:
                     return value
                 del self._cache[key]
         return None
@@ -25,21 +31,19 @@ class TTLCache:
     def set(self, key: str, value):
         """Set cached value with TTL, evicting to stay under max_size."""
         with self._lock:
-            now = time.time()
-            if key not in self._cache and len(self._cache) >= self._max_size:
+            now = time.monotonic()
+            if self._cache.pop(key, None) is None and len(self._cache) >= self._max_size:
                 self._evict_to_fit(now)
             self._cache[key] = (value, now + self._ttl)
 
     def _evict_to_fit(self, now):
         """Drop expired entries, then oldest ones, until under max_size."""
-        expired = [k for k, (_, expires) in self._cache.items() if expires <= now]
-        for k in expired:
-            del self._cache[k]
-        overage = len(self._cache) - self._max_size + 1
-        if overage > 0:
-            oldest = sorted(self._cache.items(), key=lambda kv: kv[1][1])[:overage]
-            for k, _ in oldest:
-                del self._cache[k]
+        cache = self._cache
+        while cache:
+            oldest = next(iter(cache))
+            if cache[oldest][1] > now and len(cache) < self._max_size:
+                break
+            del cache[oldest]
 
     def invalidate(self, key: str = None):
         """Invalidate specific key or entire cache."""
@@ -1,21 +1,25 @@
 """Feed management: get_feed_map, invalidate_feed_cache, refresh_rss_feed, refresh_all_feeds."""
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 from config import (
     FEED_REFRESH_FAILURE_ALERT_THRESHOLD,
     FEED_REFRESH_FAILURE_COUNT_INTERVAL,
+    FEED_REFRESH_MAX_PER_HOST,
+    FEED_REFRESH_MAX_WORKERS,
     title_matches_skip_patterns,
 )
 
-from database.episodes import normalize_published_at
 from database.podcasts import podping_declaration_columns
 from database.queue import compute_queue_priority
 from utils.http import safe_url_for_log
-from utils.time import parse_iso_utc, utc_now_iso
+from utils.time import ISO_FORMAT, parse_iso_utc, utc_now_iso
 
 from slugify import slugify
 
@@ -47,6 +51,29 @@ _feed_cache = TTLCache(ttl_seconds=30)
 _refresh_coalesce = TTLCache(ttl_seconds=30)
 
 
+def _parse_published(published):
+    """Parse an episode's RSS pubDate once for the auto-process loop.
+
+    Returns ``(iso_published, pub_date)``. ``iso_published`` matches
+    ``normalize_published_at(published) or None`` (the dedup key stored on
+    the row); ``pub_date`` is the tz-aware RFC 2822 parse used for the
+    recency check, or None when the value does not parse.
+    """
+    if not published:
+        return None, None
+    try:
+        pub_date = parsedate_to_datetime(published)
+    except (ValueError, TypeError):
+        pub_date = None
+    if published[0].isdigit() or pub_date is None:
+        iso_published = published
+    else:
+        iso_published = pub_date.strftime(ISO_FORMAT)
+    if pub_date is not None and pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+    return iso_published, pub_date
+
+
 def _scrub_query_strings(text: str) -> str:
     """Drop query strings from any URL embedded in an error message --
     private-feed tokens live there, and this text is persisted, shown in
@@ -111,6 +138,14 @@ def _record_refresh_success(slug: str):
         refresh_logger.exception(f"[{slug}] Failed to clear refresh failure state")
 
 
+@lru_cache(maxsize=2048)
+def _feed_slug(out_path: str) -> str:
+    """Slug for a feed's ``out`` path. Pure, so memoised across rebuilds of
+    the feed map instead of re-running slugify's normalize/regex pipeline
+    for every feed every 30 s."""
+    return slugify(out_path.strip('/'))
+
+
 def get_feed_map():
     """Get feed map from database, with TTL caching."""
     cached = _feed_cache.get('all_feeds')
@@ -118,14 +153,21 @@ def get_feed_map():
         return cached
 
     feeds = db.get_feeds_config()
-    result = {slugify(feed['out'].strip('/')): feed for feed in feeds}
+    result = {_feed_slug(feed['out']): feed for feed in feeds}
     _feed_cache.set('all_feeds', result)
     return result
 
 
-def invalidate_feed_cache():
-    """Invalidate feed cache after any feed modification."""
+def invalidate_feed_cache(slug=None):
+    """Invalidate feed cache after any feed modification.
+
+    With ``slug``, also drop the per-slug upstream state the feed routes keep,
+    for a feed whose source changed or that was deleted.
+    """
     _feed_cache.invalidate('all_feeds')
+    if slug:
+        from main_app.routes import evict_feed_caches
+        evict_feed_caches(slug)
 
 
 def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
@@ -173,8 +215,9 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
             # If no episodes exist yet (pre-v1.0.41 feed), force full fetch for initial discovery
             _, discovered_count = db.get_episodes(slug, status='discovered', limit=1)
             if discovered_count > 0:
-                # Even on 304, ensure artwork is cached (may be missing after DB restore)
-                podcast = db.get_podcast_by_slug(slug)
+                # Even on 304, ensure artwork is cached (may be missing after DB restore).
+                # The row read at the top of the refresh is still current:
+                # nothing has written it since.
                 # A 304 carries no body, so a steady-state feed would never
                 # have its <podcast:podping> tag ingested (#579). Stamped only
                 # on a successful fetch, so a failing feed retries each cycle.
@@ -356,12 +399,21 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
         all_episodes = rss_parser.extract_episodes(
             feed_content, parsed_feed=parsed_feed, source=slug)
         inserted = db.bulk_upsert_discovered_episodes(slug, all_episodes)
+        # Keep the upstream body so serve_episode can look up enclosure URLs
+        # without its own upstream round-trip. A 304 leaves it as-is: the
+        # upstream copy is unchanged by definition.
+        try:
+            storage.save_original_rss(slug, feed_content)
+        except Exception as e:
+            refresh_logger.warning(f"[{slug}] Failed to save upstream RSS: {e}")
         if inserted > 0:
             refresh_logger.info(f"[{slug}] Discovered {inserted} new episode(s)")
 
         # Queue new episodes for auto-processing if enabled
         # Only queue episodes published within the last 48 hours to avoid processing entire backlog
-        if db.is_auto_process_enabled_for_podcast(slug):
+        # The row fetched at the top of the refresh carries the override
+        # column; reuse it instead of a second podcast lookup.
+        if db.is_auto_process_enabled_for_podcast(slug, podcast=podcast):
             queued_count = 0
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=48)
             # Read once per refresh, not per episode.
@@ -376,7 +428,9 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
                 if existing_status is None or existing_status == 'discovered':
                     # Also check by title+pubDate to catch ID changes (Megaphone feeds, etc.)
                     # This prevents duplicate processing when RSS GUID changes
-                    iso_published = normalize_published_at(ep.get('published', '')) or None
+                    # One RFC 2822 parse feeds both the dedup key and the
+                    # 48-hour recency check below.
+                    iso_published, pub_date = _parse_published(ep.get('published', ''))
 
                     if iso_published and ep.get('title'):
                         existing_id = title_date_map.get((ep.get('title'), iso_published))
@@ -387,21 +441,13 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
                             )
                             continue  # Skip - episode already exists with different ID
 
-                    # Parse publish date to check if recent
+                    # Check if recent
                     is_recent = False
-                    published_str = ep.get('published', '')
-                    if published_str:
-                        try:
-                            # RSS dates are typically RFC 2822 format
-                            pub_date = parsedate_to_datetime(published_str)
-                            # Ensure timezone-aware for comparison
-                            if pub_date.tzinfo is None:
-                                pub_date = pub_date.replace(tzinfo=timezone.utc)
-                            is_recent = pub_date >= cutoff_time
-                        except (ValueError, TypeError):
-                            # If we can't parse the date, skip this episode for auto-process
-                            refresh_logger.debug(f"[{slug}] Could not parse date for episode: {ep.get('title')}")
-                            is_recent = False
+                    if pub_date is not None:
+                        is_recent = pub_date >= cutoff_time
+                    elif iso_published:
+                        # If we can't parse the date, skip this episode for auto-process
+                        refresh_logger.debug(f"[{slug}] Could not parse date for episode: {ep.get('title')}")
 
                     if is_recent:
                         if title_matches_skip_patterns(
@@ -442,6 +488,18 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
         return False
 
 
+def _feed_host(feed_url: str) -> str:
+    """Lowercased host of a feed URL, '' when it has none.
+
+    A malformed URL also maps to '', so that row fails in its own
+    refresh instead of aborting the whole pass.
+    """
+    try:
+        return (urlsplit(feed_url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
 def refresh_all_feeds(force: bool = False):
     """Refresh all RSS feeds in parallel.
 
@@ -456,18 +514,38 @@ def refresh_all_feeds(force: bool = False):
 
         feed_map = get_feed_map()
 
-        # Parallelize feed refresh with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(refresh_rss_feed, slug, feed_info['in'], force): slug
-                for slug, feed_info in feed_map.items()
-            }
-            for future in as_completed(futures):
-                slug = futures[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    refresh_logger.error(f"[{slug}] Feed refresh failed: {e}")
+        # Parallelize feed refresh with ThreadPoolExecutor. Workers mostly
+        # wait on upstream HTTP, so size the pool to the feed count (capped).
+        # The per-host cap is enforced at admission, not inside the worker:
+        # each host has at most FEED_REFRESH_MAX_PER_HOST feeds submitted at
+        # a time and its next feed goes in as one finishes, so a worker is
+        # never parked waiting on a busy host while other hosts' feeds queue.
+        workers = min(FEED_REFRESH_MAX_WORKERS, max(1, len(feed_map)))
+        by_host = defaultdict(deque)
+        for slug, feed_info in feed_map.items():
+            by_host[_feed_host(feed_info['in'])].append((slug, feed_info['in']))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+
+            def _admit(host):
+                slug, feed_url = by_host[host].popleft()
+                pending[executor.submit(refresh_rss_feed, slug, feed_url, force)] = (slug, host)
+
+            # Round-robin the first slots so every host starts early.
+            for _ in range(FEED_REFRESH_MAX_PER_HOST):
+                for host, queued in by_host.items():
+                    if queued:
+                        _admit(host)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    slug, host = pending.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        refresh_logger.error(f"[{slug}] Feed refresh failed: {e}")
+                    if by_host[host]:
+                        _admit(host)
 
         refresh_logger.info(f"RSS refresh complete for {len(feed_map)} feeds")
         # Stamp when the all-feeds pass finished; the dashboard shows this
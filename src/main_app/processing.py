@@ -2,10 +2,13 @@
 import json
 import logging
 import os
+import re
 import shutil
 import tempfile
 import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import requests.exceptions
@@ -28,6 +31,7 @@ from audio_analysis.cue_template_matcher import AudioCueTemplateMatcher
 from audio_processor import get_replacement_duration, AudioProcessor
 from cancel import ProcessingCancelled, _check_cancel, _cancel_events, _cancel_events_lock
 from differential_fetcher import fetch_and_diff, is_likely_dai_feed
+from roll_detector import detect_preroll, detect_postroll
 from utils.audio import get_audio_codec, get_audio_duration
 from utils.time import (
     adjust_timestamp, merge_cut_spans, overlap_ratio, overlap_seconds,
@@ -140,6 +144,31 @@ def get_min_cut_confidence() -> float:
     return MIN_CUT_CONFIDENCE
 
 
+def _substring_union(patterns):
+    """One regex matching any of ``patterns`` as a plain substring."""
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+# Message fragments for is_transient_error, each category compiled to a
+# single alternation so a message is scanned once per category.
+_OOM_ERROR_RE = _substring_union([
+    'out of memory', 'oom', 'cuda out of memory',
+    'cannot allocate memory', 'memory allocation failed',
+    'killed', 'memoryerror', 'torch.cuda.outofmemoryerror',
+])
+_CDN_TRANSIENT_ERROR_RE = _substring_union([
+    'cdn not ready', 'cdn timeout', 'cdn server error', 'cdn check failed',
+])
+# Permanent content/auth errors. 404 / "not found" is deliberately absent:
+# a freshly published episode 404s briefly while the host provisions the
+# media URL, so it is transient (the retry cap still fails a dead link).
+_PERMANENT_ERROR_RE = _substring_union([
+    'invalid audio', 'unsupported format', 'corrupt',
+    'authentication', 'unauthorized', 'forbidden',
+    '400 ', '401 ', '403 ',
+])
+
+
 def is_transient_error(error: Exception) -> bool:
     """Determine if an error is transient (worth retrying) or permanent.
 
@@ -192,37 +221,42 @@ def is_transient_error(error: Exception) -> bool:
     error_msg = str(error).lower()
 
     # OOM errors are PERMANENT - retrying without more RAM won't help
-    oom_patterns = [
-        'out of memory', 'oom', 'cuda out of memory',
-        'cannot allocate memory', 'memory allocation failed',
-        'killed', 'memoryerror', 'torch.cuda.outofmemoryerror',
-    ]
-    if any(pattern in error_msg for pattern in oom_patterns):
+    if _OOM_ERROR_RE.search(error_msg):
         return False
 
     # CDN errors are transient
-    transient_patterns = [
-        'cdn not ready', 'cdn timeout', 'cdn server error', 'cdn check failed',
-    ]
-    if any(pattern in error_msg for pattern in transient_patterns):
+    if _CDN_TRANSIENT_ERROR_RE.search(error_msg):
         return True
 
-    # Permanent content/auth errors. 404 / "not found" is deliberately absent:
-    # a freshly published episode 404s briefly while the host provisions the
-    # media URL, so it is transient (the retry cap still fails a dead link).
-    permanent_patterns = [
-        'invalid audio', 'unsupported format', 'corrupt',
-        'authentication', 'unauthorized', 'forbidden',
-        '400 ', '401 ', '403 ',
-    ]
-    if any(pattern in error_msg for pattern in permanent_patterns):
+    if _PERMANENT_ERROR_RE.search(error_msg):
         return False
 
     # Default: assume transient for unknown errors (safer to retry)
     return True
 
 
-def _process_episode_background(slug, episode_id, original_url, title, podcast_name, description, artwork_url, published_at=None, cancel_event=None):
+# Transcript outputs (final segments, VTT, plain text) are written here while
+# _generate_assets runs the chapter step on the caller's thread, so the CPU
+# work overlaps the chapter LLM call instead of running ahead of it.
+_asset_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='assets')
+
+
+# Set when a background processing thread exits, so the queue drainer's
+# waiter wakes as soon as the job ends instead of on its next poll. Each
+# job gets its own Event: a finishing thread sets the one it was started
+# with, so a late set() can never mark the job that replaced it as done.
+_job_finished = threading.Event()
+
+
+def wait_for_background_job(timeout: float) -> bool:
+    """Block up to ``timeout`` seconds for the running background job to end.
+
+    Returns True once its thread has exited.
+    """
+    return _job_finished.wait(timeout)
+
+
+def _process_episode_background(slug, episode_id, original_url, title, podcast_name, description, artwork_url, published_at=None, cancel_event=None, job_finished=None):
     """Background thread wrapper for process_episode with queue management."""
     from processing_queue import ProcessingQueue
     queue = ProcessingQueue()
@@ -266,6 +300,8 @@ def _process_episode_background(slug, episode_id, original_url, title, podcast_n
         queue.release()
         with _cancel_events_lock:
             _cancel_events.pop(f"{slug}:{episode_id}", None)
+        if job_finished is not None:
+            job_finished.set()
 
 
 def start_background_processing(slug, episode_id, original_url, title, podcast_name, description, artwork_url, published_at=None):
@@ -278,6 +314,7 @@ def start_background_processing(slug, episode_id, original_url, title, podcast_n
         - (False, "already_processing") if this episode is already being processed
         - (False, "queue_busy:slug:episode_id") if another episode is processing
     """
+    global _job_finished
     from processing_queue import ProcessingQueue
     queue = ProcessingQueue()
 
@@ -303,9 +340,11 @@ def start_background_processing(slug, episode_id, original_url, title, podcast_n
         _cancel_events[key] = cancel_event
 
     # Start background thread
+    job_finished = threading.Event()
+    _job_finished = job_finished
     processing_thread = threading.Thread(
         target=_process_episode_background,
-        args=(slug, episode_id, original_url, title, podcast_name, description, artwork_url, published_at, cancel_event),
+        args=(slug, episode_id, original_url, title, podcast_name, description, artwork_url, published_at, cancel_event, job_finished),
         daemon=True
     )
     processing_thread.start()
@@ -550,7 +589,12 @@ def _run_audio_analysis(slug, episode_id, audio_path, segments, force_cue_detect
         if result.splice_evidence is not None:
             result.splice_evidence['calibration'] = compute_splice_calibration(
                 db, slug, exclude_episode_id=episode_id)
-        db.save_episode_audio_analysis(slug, episode_id, json.dumps(result.to_dict()))
+        # Compact separators: the payload carries every per-window signal, is
+        # only ever read back by json.loads, and is encoded on the processing
+        # thread, so the default ', '/': ' padding is pure encode and storage
+        # overhead.
+        db.save_episode_audio_analysis(
+            slug, episode_id, json.dumps(result.to_dict(), separators=(',', ':')))
         return result
     except Exception as e:
         audio_logger.error(f"[{slug}:{episode_id}] Audio analysis failed: {e}")
@@ -954,7 +998,6 @@ def _apply_heuristic_rolls(slug, episode_id, all_ads, segments, podcast_name,
     """Append heuristic pre/post-roll and VAD-gap ads to ``all_ads`` in place."""
     if not segments:
         return
-    from roll_detector import detect_preroll, detect_postroll
     preroll_ad = detect_preroll(segments, all_ads, podcast_name=podcast_name,
                                 skip_patterns=skip_patterns)
     if preroll_ad:
@@ -1262,16 +1305,18 @@ def _refine_and_validate(slug, episode_id, all_ads, segments, audio_path,
     Returns (ads_to_remove, all_ads_with_validation).
     """
     # Load corrections first: the filler-gap merge needs the FP ranges so it
-    # does not collapse a span the user rejected.
-    false_positive_corrections, confirmed_corrections = _load_user_corrections(
-        slug, episode_id, db
-    )
+    # does not collapse a span the user rejected. With no first-pass ads
+    # there is nothing to refine, so defer the load until the heuristic
+    # rolls have had a chance to add something to validate.
+    corrections = None
+    if all_ads:
+        corrections = _load_user_corrections(slug, episode_id, db)
 
-    # Boundary refinement
-    all_ads = _refine_boundaries(all_ads, segments, db=db,
-                                 false_positive_corrections=false_positive_corrections,
-                                 podcast_name=podcast_name,
-                                 keep_ads=keep_ads)
+        # Boundary refinement
+        all_ads = _refine_boundaries(all_ads, segments, db=db,
+                                     false_positive_corrections=corrections[0],
+                                     podcast_name=podcast_name,
+                                     keep_ads=keep_ads)
 
     # Heuristic pre/post-roll detection
     if apply_heuristic_rolls:
@@ -1282,6 +1327,9 @@ def _refine_and_validate(slug, episode_id, all_ads, segments, audio_path,
     # Validation
     if not all_ads:
         return [], []
+    if corrections is None:
+        corrections = _load_user_corrections(slug, episode_id, db)
+    false_positive_corrections, confirmed_corrections = corrections
 
     validator = _build_validator(
         episode_duration, segments, episode_description,
@@ -1363,13 +1411,14 @@ def _build_episode_meta(slug, episode_id, podcast_id, podcast_name,
 
 def _log_reviewer_verdicts(slug, episode_id, pass_num, verdicts):
     """Log the per-verdict counts for a reviewer pass."""
+    counts = Counter(v.verdict for v in verdicts)
     audio_logger.info(
         f"[{slug}:{episode_id}] Reviewer pass {pass_num} verdicts: "
-        f"{sum(1 for v in verdicts if v.verdict == 'confirmed')} confirmed, "
-        f"{sum(1 for v in verdicts if v.verdict == 'adjust')} adjusted, "
-        f"{sum(1 for v in verdicts if v.verdict == 'reject')} rejected, "
-        f"{sum(1 for v in verdicts if v.verdict == 'resurrect')} resurrected, "
-        f"{sum(1 for v in verdicts if v.verdict == 'failure')} failed"
+        f"{counts['confirmed']} confirmed, "
+        f"{counts['adjust']} adjusted, "
+        f"{counts['reject']} rejected, "
+        f"{counts['resurrect']} resurrected, "
+        f"{counts['failure']} failed"
     )
 
 
@@ -1809,7 +1858,6 @@ def _apply_pass2_heuristic_rolls(slug, episode_id, verification_ads_processed,
     """Append pass-2 heuristic pre/post-rolls in both processed and original coords."""
     if not verification_segments:
         return
-    from roll_detector import detect_preroll, detect_postroll
     processed_dur = verification_segments[-1]['end'] if verification_segments else 0
     ts_map = _build_timestamp_map(ads_to_remove) if ads_to_remove else None
     beep = get_replacement_duration()
@@ -2290,15 +2338,18 @@ def _recut_processed_audio(slug, episode_id, processed_path, v_ads_to_cut,
     # instead of silently falling back to a full remove.
     audio_segments = [dict(ad, beep=(ad.get('action_applied') == 'beep'))
                       for ad in v_ads_to_cut]
-    recut_result = local_audio_processor.process_episode(processed_path, audio_segments)
+    recut_result = local_audio_processor.process_episode(
+        processed_path, audio_segments,
+        output_dir=os.path.dirname(processed_path))
     if recut_result:
         recut_path, recut_applied = recut_result
-        if os.path.exists(processed_path):
-            try:
-                os.unlink(processed_path)
-            except OSError as e:
-                audio_logger.warning(f"[{slug}:{episode_id}] Failed to remove old processed file: {e}")
-        processed_path = recut_path
+        # The recut renders into the same directory, so one rename swaps it
+        # over the pass-1 output; the path handed back stays the same.
+        try:
+            os.replace(recut_path, processed_path)
+        except OSError as e:
+            audio_logger.warning(f"[{slug}:{episode_id}] Failed to replace old processed file: {e}")
+            processed_path = recut_path
         audio_logger.info(f"[{slug}:{episode_id}] Re-cut pass 1 output, removed {len(recut_applied)} additional ads")
         return processed_path, recut_applied, True
     audio_logger.error(f"[{slug}:{episode_id}] Verification re-cut failed, keeping pass 1 output")
@@ -2726,16 +2777,50 @@ def _generate_assets(slug, episode_id, segments, all_cuts, episode_description,
     markers, when given, is the ad/segment marker list used to build
     topic-boundary hints for the generator's prompt (see chapters_generator.
     build_segment_hints). Only used by the AI-generation branch.
+
+    The transcript outputs and the chapter step are independent, so the
+    transcript half runs on _asset_pool while the chapter step (usually an
+    LLM call) runs here; this returns once both are done.
     """
-    from transcript_generator import TranscriptGenerator
-    from chapters_generator import ChaptersGenerator
     try:
-        vtt_enabled = db.get_setting('vtt_transcripts_enabled')
-        transcript_gen = TranscriptGenerator()
-
         # Each cut is replaced by the beep, so post-cut timestamps shift by
         # (cut - beep) per cut, not the full cut length.
         replacement_duration = get_replacement_duration()
+        transcript_job = _asset_pool.submit(
+            _write_transcript_assets, slug, episode_id, segments, all_cuts,
+            replacement_duration)
+    except Exception as e:
+        audio_logger.warning(f"[{slug}:{episode_id}] Failed to generate Podcasting 2.0 assets: {e}")
+        return
+
+    # Each half is logged on its own so a failure in one never hides the other.
+    try:
+        _write_chapter_assets(
+            slug, episode_id, segments, all_cuts, episode_description,
+            podcast_name, episode_title, replacement_duration,
+            regenerate_chapters=regenerate_chapters,
+            audio_path=audio_path, audio_duration=audio_duration,
+            previous_cuts=previous_cuts,
+            original_duration=original_duration,
+            podcast_row=podcast_row, run_stats=run_stats, markers=markers)
+    except Exception as e:
+        audio_logger.warning(f"[{slug}:{episode_id}] Failed to generate chapters: {e}")
+    try:
+        transcript_job.result()
+    except Exception as e:
+        audio_logger.warning(f"[{slug}:{episode_id}] Failed to generate transcript: {e}")
+
+
+def _write_transcript_assets(slug, episode_id, segments, all_cuts, replacement_duration):
+    """Persist final segments, the VTT transcript and the plain-text transcript.
+
+    Runs on _asset_pool, whose threads keep their own DB connections, so a
+    failure clears any transaction it left open before re-raising (#566).
+    """
+    from transcript_generator import TranscriptGenerator
+    try:
+        vtt_enabled = db.get_setting('vtt_transcripts_enabled')
+        transcript_gen = TranscriptGenerator()
 
         # Persist final segments unconditionally; consumers (e.g. the offline
         # benchmark) need them even when VTT generation is disabled.
@@ -2751,138 +2836,147 @@ def _generate_assets(slug, episode_id, segments, all_cuts, episode_description,
         processed_text = transcript_gen.generate_text(segments, all_cuts, replacement_duration)
         if processed_text:
             db.save_episode_details(slug, episode_id, transcript_text=processed_text)
+    except Exception:
+        db.clear_leaked_transaction(audio_logger, 'transcript assets')
+        raise
+
 
-        chapters_enabled = db.get_setting('chapters_enabled')
-        if not regenerate_chapters:
-            audio_logger.info(f"[{slug}:{episode_id}] Skipping chapter regeneration (no AI call)")
-            _remap_stored_chapters(slug, episode_id, all_cuts,
-                                   replacement_duration, previous_cuts,
-                                   original_duration,
-                                   audio_path=audio_path,
-                                   audio_duration=audio_duration)
-        elif chapters_enabled is None or chapters_enabled.lower() == 'true':
-            if podcast_row is None:
-                podcast_row = db.get_podcast_by_slug(slug)
-            chapters_mode = resolve_chapters_mode(podcast_row)
-            if chapters_mode == CHAPTERS_MODE_OFF:
-                audio_logger.info(f"[{slug}:{episode_id}] Chapters mode 'off'; skipping chapter step")
+def _write_chapter_assets(slug, episode_id, segments, all_cuts, episode_description,
+                          podcast_name, episode_title, replacement_duration, *,
+                          regenerate_chapters, audio_path, audio_duration,
+                          previous_cuts, original_duration, podcast_row,
+                          run_stats, markers):
+    """Chapter step of _generate_assets: remap, preserve or generate chapters."""
+    from chapters_generator import ChaptersGenerator
+    chapters_enabled = db.get_setting('chapters_enabled')
+    if not regenerate_chapters:
+        audio_logger.info(f"[{slug}:{episode_id}] Skipping chapter regeneration (no AI call)")
+        _remap_stored_chapters(slug, episode_id, all_cuts,
+                               replacement_duration, previous_cuts,
+                               original_duration,
+                               audio_path=audio_path,
+                               audio_duration=audio_duration)
+    elif chapters_enabled is None or chapters_enabled.lower() == 'true':
+        if podcast_row is None:
+            podcast_row = db.get_podcast_by_slug(slug)
+        chapters_mode = resolve_chapters_mode(podcast_row)
+        if chapters_mode == CHAPTERS_MODE_OFF:
+            audio_logger.info(f"[{slug}:{episode_id}] Chapters mode 'off'; skipping chapter step")
+            return
+        # 'auto' probes the PROCESSED file: the ffmpeg cut step already
+        # remapped publisher ID3 CHAP frames onto the cut timeline
+        # (audio_processor.py), so a probe here gives the remapped list
+        # for free with no extra work. 'generate' never probes, so it
+        # always falls through to the generator below regardless of what
+        # publisher chapters exist.
+        publisher = []
+        if chapters_mode == CHAPTERS_MODE_AUTO and audio_path:
+            publisher = probe_chapters(str(audio_path))
+            if publisher is None:
+                # Probe failed (e.g. transient ffprobe error), not "the
+                # file definitively has no chapters" (embedded_chapters.
+                # probe_chapters). Falling through to the generate+embed
+                # path below would overwrite the ID3 frames the cut step
+                # already wrote correctly, the exact failure mode issue
+                # #500 prevents at the ffmpeg layer. Skip the chapter
+                # step this run instead of guessing.
+                audio_logger.warning(
+                    f"[{slug}:{episode_id}] Chapter probe failed after "
+                    f"cut; skipping chapter step this run")
                 return
-            # 'auto' probes the PROCESSED file: the ffmpeg cut step already
-            # remapped publisher ID3 CHAP frames onto the cut timeline
-            # (audio_processor.py), so a probe here gives the remapped list
-            # for free with no extra work. 'generate' never probes, so it
-            # always falls through to the generator below regardless of what
-            # publisher chapters exist.
-            publisher = []
-            if chapters_mode == CHAPTERS_MODE_AUTO and audio_path:
-                publisher = probe_chapters(str(audio_path))
-                if publisher is None:
-                    # Probe failed (e.g. transient ffprobe error), not "the
-                    # file definitively has no chapters" (embedded_chapters.
-                    # probe_chapters). Falling through to the generate+embed
-                    # path below would overwrite the ID3 frames the cut step
-                    # already wrote correctly, the exact failure mode issue
-                    # #500 prevents at the ffmpeg layer. Skip the chapter
-                    # step this run instead of guessing.
-                    audio_logger.warning(
-                        f"[{slug}:{episode_id}] Chapter probe failed after "
-                        f"cut; skipping chapter step this run")
-                    return
-            if len(publisher) >= MIN_PRESERVED_CHAPTERS:
-                chapters_json = {
-                    'version': '1.2.0',
-                    'chapters': [
-                        {
-                            # min 1 (not 0): some podcast apps require
-                            # chapters to start at 1, matching the same
-                            # floor the generator applies below.
-                            'startTime': max(1, int(round(c['start']))),
-                            'title': c.get('title') or f"Chapter {i + 1}",
+        if len(publisher) >= MIN_PRESERVED_CHAPTERS:
+            chapters_json = {
+                'version': '1.2.0',
+                'chapters': [
+                    {
+                        # min 1 (not 0): some podcast apps require
+                        # chapters to start at 1, matching the same
+                        # floor the generator applies below.
+                        'startTime': max(1, int(round(c['start']))),
+                        'title': c.get('title') or f"Chapter {i + 1}",
+                    }
+                    for i, c in enumerate(publisher)
+                ],
+            }
+            # Persisted in one DB write; no embed_chapters call and no
+            # LLM call happen here since the frames are already embedded
+            # by the cut step.
+            storage.save_chapters_and_applied_cuts(
+                slug, episode_id, chapters_json, all_cuts or [])
+            audio_logger.info(
+                f"[{slug}:{episode_id}] Preserved {len(publisher)} "
+                f"publisher chapter(s) (no AI call)")
+            return
+        # Embedded chapters came up short. Some feeds publish chapters
+        # only as a separate podcast:chapters JSON file (issue #560
+        # follow-up), captured at RSS refresh as
+        # episodes.upstream_chapters_url; try fetching that next, before
+        # falling back to generation. The probe above must not risk
+        # overwriting correctly-embedded ID3 frames on a failed read, so
+        # it skips the run instead. A fetch failure here (None) has no
+        # such risk, so it is deliberately let through to the generator: a
+        # bad or unreachable remote file must not block chapters
+        # outright, only lose the chance to preserve the publisher's own
+        # set.
+        if chapters_mode == CHAPTERS_MODE_AUTO and original_duration:
+            episode_row = db.get_episode(slug, episode_id)
+            upstream_url = (episode_row or {}).get('upstream_chapters_url')
+            if upstream_url:
+                fetched = fetch_upstream_chapters(upstream_url)
+                if fetched is not None:
+                    remapped = _remap_chapters_for_recut(
+                        fetched, [], all_cuts or [], replacement_duration,
+                        original_duration, audio_duration)
+                    if len(remapped) >= MIN_PRESERVED_CHAPTERS:
+                        chapters_json = {
+                            'version': '1.2.0',
+                            'chapters': [
+                                {**ch, 'title': ch.get('title') or f"Chapter {i + 1}"}
+                                for i, ch in enumerate(remapped)
+                            ],
                         }
-                        for i, c in enumerate(publisher)
-                    ],
-                }
-                # Persisted in one DB write; no embed_chapters call and no
-                # LLM call happen here since the frames are already embedded
-                # by the cut step.
-                storage.save_chapters_and_applied_cuts(
-                    slug, episode_id, chapters_json, all_cuts or [])
-                audio_logger.info(
-                    f"[{slug}:{episode_id}] Preserved {len(publisher)} "
-                    f"publisher chapter(s) (no AI call)")
-                return
-            # Embedded chapters came up short. Some feeds publish chapters
-            # only as a separate podcast:chapters JSON file (issue #560
-            # follow-up), captured at RSS refresh as
-            # episodes.upstream_chapters_url; try fetching that next, before
-            # falling back to generation. The probe above must not risk
-            # overwriting correctly-embedded ID3 frames on a failed read, so
-            # it skips the run instead. A fetch failure here (None) has no
-            # such risk, so it is deliberately let through to the generator: a
-            # bad or unreachable remote file must not block chapters
-            # outright, only lose the chance to preserve the publisher's own
-            # set.
-            if chapters_mode == CHAPTERS_MODE_AUTO and original_duration:
-                episode_row = db.get_episode(slug, episode_id)
-                upstream_url = (episode_row or {}).get('upstream_chapters_url')
-                if upstream_url:
-                    fetched = fetch_upstream_chapters(upstream_url)
-                    if fetched is not None:
-                        remapped = _remap_chapters_for_recut(
-                            fetched, [], all_cuts or [], replacement_duration,
-                            original_duration, audio_duration)
-                        if len(remapped) >= MIN_PRESERVED_CHAPTERS:
-                            chapters_json = {
-                                'version': '1.2.0',
-                                'chapters': [
-                                    {**ch, 'title': ch.get('title') or f"Chapter {i + 1}"}
-                                    for i, ch in enumerate(remapped)
-                                ],
-                            }
-                            # Unlike the embedded-preserve path above, the
-                            # served file has no chapter frames yet (the cut
-                            # step only remapped what was already embedded),
-                            # so this mirrors the generate path's embed call
-                            # below rather than skipping it.
-                            storage.save_chapters_and_applied_cuts(
-                                slug, episode_id, chapters_json, all_cuts or [])
-                            audio_logger.info(
-                                f"[{slug}:{episode_id}] Preserved {len(remapped)} "
-                                f"upstream JSON chapter(s) (no AI call)")
-                            if audio_path:
-                                embed_chapters(str(audio_path),
-                                              chapters_json['chapters'],
-                                              duration=audio_duration)
-                            return
-            chapters_gen = ChaptersGenerator()
-            clear_fallback(episode_id, PASS_CHAPTER_GENERATION)
-            chapters = chapters_gen.generate_chapters(
-                segments,
-                episode_description=episode_description,
-                ads_removed=all_cuts,
-                podcast_name=podcast_name,
-                episode_title=episode_title,
-                episode_id=episode_id,
-                replacement_duration=replacement_duration,
-                segment_markers=markers,
-            )
-            if run_stats is not None and chapters_gen.chapters_degraded:
-                run_stats['chapters_degraded'] = True
-                run_stats['chapters_degraded_reason'] = chapters_gen.chapters_degradation_reason
-            if chapters and chapters.get('chapters'):
-                # Chapters and the applied cut list they were generated
-                # against (all_cuts, original-episode coordinates) persist in
-                # ONE DB write: a later recut remaps from this authoritative
-                # list, and a failure between two separate writes would leave
-                # fresh chapters with stale cuts and poison that remap.
-                storage.save_chapters_and_applied_cuts(
-                    slug, episode_id, chapters, all_cuts or [])
-                audio_logger.info(f"[{slug}:{episode_id}] Generated {len(chapters['chapters'])} chapters")
-                if audio_path:
-                    embed_chapters(str(audio_path), chapters['chapters'],
-                                   duration=audio_duration)
-    except Exception as e:
-        audio_logger.warning(f"[{slug}:{episode_id}] Failed to generate Podcasting 2.0 assets: {e}")
+                        # Unlike the embedded-preserve path above, the
+                        # served file has no chapter frames yet (the cut
+                        # step only remapped what was already embedded),
+                        # so this mirrors the generate path's embed call
+                        # below rather than skipping it.
+                        storage.save_chapters_and_applied_cuts(
+                            slug, episode_id, chapters_json, all_cuts or [])
+                        audio_logger.info(
+                            f"[{slug}:{episode_id}] Preserved {len(remapped)} "
+                            f"upstream JSON chapter(s) (no AI call)")
+                        if audio_path:
+                            embed_chapters(str(audio_path),
+                                          chapters_json['chapters'],
+                                          duration=audio_duration)
+                        return
+        chapters_gen = ChaptersGenerator()
+        clear_fallback(episode_id, PASS_CHAPTER_GENERATION)
+        chapters = chapters_gen.generate_chapters(
+            segments,
+            episode_description=episode_description,
+            ads_removed=all_cuts,
+            podcast_name=podcast_name,
+            episode_title=episode_title,
+            episode_id=episode_id,
+            replacement_duration=replacement_duration,
+            segment_markers=markers,
+        )
+        if run_stats is not None and chapters_gen.chapters_degraded:
+            run_stats['chapters_degraded'] = True
+            run_stats['chapters_degraded_reason'] = chapters_gen.chapters_degradation_reason
+        if chapters and chapters.get('chapters'):
+            # Chapters and the applied cut list they were generated
+            # against (all_cuts, original-episode coordinates) persist in
+            # ONE DB write: a later recut remaps from this authoritative
+            # list, and a failure between two separate writes would leave
+            # fresh chapters with stale cuts and poison that remap.
+            storage.save_chapters_and_applied_cuts(
+                slug, episode_id, chapters, all_cuts or [])
+            audio_logger.info(f"[{slug}:{episode_id}] Generated {len(chapters['chapters'])} chapters")
+            if audio_path:
+                embed_chapters(str(audio_path), chapters['chapters'],
+                               duration=audio_duration)
 
 
 def _persist_episode_state(slug, episode_id, pass1_cut_count, verification_count,
@@ -2974,9 +3068,9 @@ def _refresh_rss_for_slug(slug, episode_id):
     """Force-refresh the RSS feed cache for ``slug``, logging on failure."""
     from main_app.feeds import get_feed_map, refresh_rss_feed
     try:
-        feed_map = get_feed_map()
-        if slug in feed_map:
-            refresh_rss_feed(slug, feed_map[slug]['in'], force=True)
+        feed = get_feed_map().get(slug)
+        if feed:
+            refresh_rss_feed(slug, feed['in'], force=True)
     except Exception as cache_err:
         audio_logger.warning(f"[{slug}:{episode_id}] Failed to regenerate RSS cache: {cache_err}")
 
@@ -3427,6 +3521,7 @@ def _recut_episode(slug, episode_id, episode_title, podcast_name,
     finalize is still intact."""
 
     work_path = None
+    processed_path = None
     episode_data = db.get_episode(slug, episode_id)
     try:
         audio_logger.info(f"[{slug}:{episode_id}] Recut: \"{episode_title}\"")
@@ -3488,7 +3583,11 @@ def _recut_episode(slug, episode_id, episode_title, podcast_name,
         # an earlier pass still renders as beep on recut, not a full remove.
         audio_segments = [dict(ad, beep=(ad.get('action_applied') == 'beep'))
                           for ad in ads_to_remove]
-        result = local_audio_processor.process_episode(work_path, audio_segments)
+        # Render next to the final file so the finalize move below is a
+        # rename, not a copy of the whole episode out of /tmp.
+        result = local_audio_processor.process_episode(
+            work_path, audio_segments,
+            output_dir=os.path.dirname(storage.get_episode_path(slug, episode_id)))
         if not result:
             raise Exception("FFMPEG processing failed during recut")
         processed_path, applied_cuts = result
@@ -3593,6 +3692,14 @@ def _recut_episode(slug, episode_id, episode_title, podcast_name,
                 os.unlink(work_path)
             except OSError:
                 pass
+        # Only still present when the recut failed before the finalize move;
+        # the render now lives in the persistent episodes dir.
+        if processed_path and os.path.exists(processed_path):
+            try:
+                os.unlink(processed_path)
+            except OSError as e:
+                audio_logger.warning(
+                    f"[{slug}:{episode_id}] Failed to remove unfinished render: {e}")
 
 
 def _handle_processing_failure(slug, episode_id, episode_title, podcast_name,
@@ -3866,6 +3973,9 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             diff_thread.start()
         _check_cancel(cancel_event, slug, episode_id)
 
+        # The cut render lives in the episodes directory until the finalize
+        # move; a failure before then must not leave it behind there.
+        processed_path = None
         try:
             # Stage 2: Audio analysis (ad-cue detection; nothing to feed when
             # detection is skipped)
@@ -4006,7 +4116,9 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
                 }
                 run_stats['detected'] = first_pass_count
 
-                all_ads = first_pass_ads.copy()
+                # No copy: first_pass_ads (and ad_result['ads']) are not read
+                # again past this point, so later in-place appends are safe.
+                all_ads = first_pass_ads
 
                 # Keep-action bypass: pull 'keep' markers out before the
                 # validator/reviewer see them, so the resurrection pool
@@ -4135,7 +4247,11 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             # not stored, so persisted marker dicts never carry that flag.
             audio_segments = [dict(ad, beep=(ad['action_applied'] == 'beep'))
                               for ad in ads_to_remove]
-            result = local_audio_processor.process_episode(audio_path, audio_segments)
+            # Render next to the final file so the finalize move below is
+            # a rename, not a copy of the whole episode out of /tmp.
+            result = local_audio_processor.process_episode(
+                audio_path, audio_segments,
+                output_dir=os.path.dirname(storage.get_episode_path(slug, episode_id)))
             if not result:
                 raise Exception(
                     f"FFMPEG processing failed for {len(ads_to_remove)} ad segments "
@@ -4212,6 +4328,7 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
                 intensity = db.get_setting('audio_normalize_intensity') or 'normal'
                 normalized_path = local_audio_processor.normalize_audio(
                     processed_path, intensity=intensity,
+                    output_dir=os.path.dirname(processed_path),
                 )
                 if normalized_path:
                     if os.path.exists(processed_path):
@@ -4286,8 +4403,13 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             )
             # Final marker buckets: what actually got cut, what is waiting on
             # a human, and what stayed in the audio.
-            held_count = sum(1 for m in all_ads_with_validation if is_pending_review(m))
-            cut_count = sum(1 for m in all_ads_with_validation if m.get('was_cut'))
+            # One walk over the markers for both tallies.
+            held_count = cut_count = 0
+            for m in all_ads_with_validation:
+                if is_pending_review(m):
+                    held_count += 1
+                if m.get('was_cut'):
+                    cut_count += 1
             not_cut_count = count_not_cut(all_ads_with_validation)
             run_stats['markers'] = {
                 'cut': cut_count,
@@ -4354,6 +4476,12 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             # shut down here.
             if os.path.exists(audio_path):
                 os.unlink(audio_path)
+            if processed_path and os.path.exists(processed_path):
+                try:
+                    os.unlink(processed_path)
+                except OSError as e:
+                    audio_logger.warning(
+                        f"[{slug}:{episode_id}] Failed to remove unfinished render: {e}")
 
     except ProcessingCancelled:
         raise
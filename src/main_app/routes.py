@@ -1,4 +1,6 @@
 """Flask routes: serve_ui, serve_rss, serve_episode, serve_transcript_vtt, serve_chapters_json, health_check."""
+import gzip
+import hashlib
 import json
 import logging
 import os
@@ -6,8 +8,9 @@ import secrets
 import threading
 import time
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
+from urllib.parse import quote
 
 import requests
 import requests.exceptions
@@ -45,6 +48,7 @@ from main_app.shared_state import permanently_failed_warned as _permanently_fail
 # the positional 4-tuple from _get_components() that the audit flagged
 # as silently break-on-reorder.
 from main_app import db, storage, rss_parser, status_service
+from main_app.cache import TTLCache
 from main_app.feed_auth import KEY_RE, active_feed_key, require_feed_key
 from utils.http import client_ip
 from utils.opml import build_opml_xml
@@ -53,6 +57,12 @@ from utils.opml import build_opml_xml
 STATIC_DIR = None
 ROOT_DIR = None
 
+# Fingerprinted UI asset paths already confirmed on disk. Vite names are
+# content-hashed, so a confirmed path never changes meaning and the
+# existence check is skipped on repeat loads. Only real files are added,
+# so the set is bounded by the build output.
+_known_assets = set()
+
 # Endpoints served to podcast apps and other unauthenticated clients. None of
 # them can use a CSRF token, and minting one writes the session, which adds a
 # session cookie and `Vary: Cookie` that stops any CDN from caching the
@@ -76,6 +86,115 @@ PUBLIC_FEED_ENDPOINTS = frozenset({
 _bg_refresh_inflight = set()
 _bg_refresh_lock = threading.Lock()
 
+# serve_rss freshness window for the cached feed, in seconds.
+_RSS_FRESH_SECONDS = 15 * 60
+
+# Feeds are the largest and most-polled bodies served, and most podcast
+# apps only accept gzip. Flask-Compress would re-gzip the same XML at
+# COMPRESS_LEVEL 6 on every poll; serve_rss instead gzips at level 1
+# (feed XML is within a few percent of level 6) and reuses the bytes until
+# the feed's ETag changes. Clients offering br/zstd still go through
+# Flask-Compress. Same 500-byte floor as COMPRESS_MIN_SIZE.
+_RSS_GZIP_LEVEL = 1
+_RSS_GZIP_MIN_SIZE = 500
+_rss_gzip_cache = TTLCache(ttl_seconds=_RSS_FRESH_SECONDS, max_size=256)
+
+# Podcast apps poll feeds every few minutes and most of those polls find
+# nothing new. A strong ETag over the feed text, hashed once per version of
+# the cached file (see Storage.get_rss_with_version), lets them revalidate
+# with a 304 instead of re-downloading the body, and
+# the short max-age lets a CDN absorb bursts. Flask-Compress suffixes the
+# ETag with the encoding it applies; the pre-gzip path does the same.
+_RSS_CACHE_CONTROL = 'public, max-age=60'
+_rss_etag_cache = TTLCache(ttl_seconds=_RSS_FRESH_SECONDS, max_size=256)
+
+
+# Opt-in handoff of processed MP3 bodies to a fronting nginx. When set,
+# serve_episode answers with X-Accel-Redirect to <prefix>/<path under the
+# data dir> and nginx streams the file itself (sendfile, Range, conditional
+# GET), so a gunicorn worker is not held for the whole download. The
+# prefix must map to an `internal` nginx location aliased to the data
+# dir; see docs/environment-variables.md. Empty keeps send_file.
+_ACCEL_REDIRECT_PREFIX = os.environ.get(
+    'MINUSPOD_ACCEL_REDIRECT_PREFIX', '').strip().rstrip('/')
+
+
+def _send_episode_audio(file_path):
+    """Response for a processed MP3. Raises FileNotFoundError if missing."""
+    if _ACCEL_REDIRECT_PREFIX:
+        try:
+            rel = Path(file_path).relative_to(storage.data_dir).as_posix()
+        except ValueError:
+            rel = None
+        if rel is not None:
+            if not Path(file_path).is_file():
+                raise FileNotFoundError(file_path)
+            response = Response(mimetype='audio/mpeg')
+            response.headers['X-Accel-Redirect'] = (
+                f"{_ACCEL_REDIRECT_PREFIX}/{quote(rel)}"
+            )
+            return response
+    # send_file stats the path itself, so a missing file surfaces as
+    # FileNotFoundError without a separate exists() probe. Passing the
+    # path (not an open file) keeps the ETag/Last-Modified and Range
+    # handling that podcast apps rely on for resumes.
+    return send_file(file_path, mimetype='audio/mpeg',
+                     conditional=True, etag=True)
+
+
+def _rss_etag(slug, rss_text, version):
+    """Strong ETag for the feed text, reused until the file version changes."""
+    cached = _rss_etag_cache.get(slug)
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
+    etag = hashlib.blake2b(rss_text.encode('utf-8'), digest_size=12).hexdigest()
+    _rss_etag_cache.set(slug, (version, etag))
+    return etag
+
+
+def _rss_response(slug, rss_text, version):
+    """Response for cached feed XML, pre-gzipped for gzip-only clients.
+
+    Carries an ETag and answers a matching If-None-Match with a 304.
+    """
+    etag = _rss_etag(slug, rss_text, version)
+    encodings = request.accept_encodings
+    if (len(rss_text) < _RSS_GZIP_MIN_SIZE or not encodings['gzip']
+            or encodings['br'] or encodings['zstd']):
+        response = Response(rss_text, mimetype='application/rss+xml')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = _RSS_CACHE_CONTROL
+        return response.make_conditional(request)
+    # Keyed on the ETag so the entry holds only the compressed bytes.
+    cached = _rss_gzip_cache.get(slug)
+    if cached is not None and cached[0] == etag:
+        body = cached[1]
+    else:
+        body = gzip.compress(rss_text.encode('utf-8'),
+                             compresslevel=_RSS_GZIP_LEVEL)
+        _rss_gzip_cache.set(slug, (etag, body))
+    response = Response(body, mimetype='application/rss+xml')
+    # Flask-Compress leaves a response that is already encoded alone,
+    # apart from adding Vary: Accept-Encoding.
+    response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(f"{etag}:gzip")
+    response.headers['Cache-Control'] = _RSS_CACHE_CONTROL
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=512)
+def _last_checked_epoch(last_checked):
+    """Epoch seconds for a podcast's ``last_checked_at`` ISO string.
+
+    The value only changes when the feed is refreshed, so repeat hits on
+    ``serve_rss`` reuse the parsed float. A naive timestamp raises
+    TypeError, matching the old aware-minus-naive subtraction.
+    """
+    last_time = parse_iso_datetime(last_checked)
+    if last_time.tzinfo is None:
+        raise TypeError(f"naive last_checked timestamp: {last_checked!r}")
+    return last_time.timestamp()
+
 
 def _kick_background_refresh(slug, feed_url):
     """Run refresh_rss_feed on a daemon thread so serve_rss can return
@@ -105,17 +224,11 @@ def log_request_detailed(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         start_time = time.time()
-        ip = client_ip()
-        user_agent = request.headers.get('User-Agent', 'Unknown')[:100]
-
         try:
             result = f(*args, **kwargs)
-            elapsed = (time.time() - start_time) * 1000  # ms
-            status = result.status_code if hasattr(result, 'status_code') else 200
-            feed_logger.info(f"{request.method} {request.path} {status} {elapsed:.0f}ms [{ip}] [{user_agent}]")
-            return result
         except Exception as e:
             elapsed = (time.time() - start_time) * 1000
+            ip = client_ip()
             if isinstance(e, NotFound):
                 # Scanners probe unknown paths constantly, so a 404 to a
                 # stranger is not an operator problem.
@@ -123,6 +236,17 @@ def log_request_detailed(f):
             else:
                 feed_logger.error(f"{request.method} {request.path} ERROR {elapsed:.0f}ms [{ip}] - {e}")
             raise
+        # Feed and audio routes are the busiest in the app; skip resolving
+        # the client IP and user agent when the access line is filtered out.
+        if feed_logger.isEnabledFor(logging.INFO):
+            elapsed = (time.time() - start_time) * 1000  # ms
+            status = result.status_code if hasattr(result, 'status_code') else 200
+            ip = client_ip()
+            user_agent = request.headers.get('User-Agent', 'Unknown')
+            if len(user_agent) > 100:
+                user_agent = user_agent[:100]
+            feed_logger.info(f"{request.method} {request.path} {status} {elapsed:.0f}ms [{ip}] [{user_agent}]")
+        return result
     return decorated
 
 
@@ -132,22 +256,75 @@ def get_feed_map():
     return _get_feed_map()
 
 
+# Parsed upstream feed per slug, shared across episode requests. A podcast
+# app that starts a feed download fires one request per episode; without
+# this each one re-fetched and re-parsed the same upstream XML. The TTL
+# matches serve_rss's 15-minute staleness window. Only the fields
+# serve_episode reads are kept: descriptions can dwarf the rest of a
+# back catalog, and a cache hit takes it from the episode row instead.
+_upstream_episodes_cache = TTLCache(ttl_seconds=900, max_size=256)
+_UPSTREAM_EPISODE_FIELDS = ('id', 'url', 'title', 'artwork_url', 'published')
+
+
+def evict_feed_caches(slug):
+    """Drop this worker's per-slug upstream state for a repointed or
+    deleted feed."""
+    _upstream_episodes_cache.invalidate(slug)
+
+
+def _index_upstream_feed(slug, original_feed):
+    """Parse an upstream feed body into (podcast_name, {episode_id: episode})
+    and cache a slimmed copy for later lookups. The returned episodes are
+    complete."""
+    parsed_feed = rss_parser.parse_feed(original_feed, source=slug)
+    podcast_name = parsed_feed.feed.get('title', 'Unknown') if parsed_feed else 'Unknown'
+    episodes = rss_parser.extract_episodes(
+        original_feed, parsed_feed=parsed_feed, source=slug)
+    # Built once per parse so each lookup is a dict hit rather than a scan
+    # of a back catalog that can run to thousands of items. setdefault keeps
+    # the first item for a duplicated id, matching the old linear scan.
+    episodes_by_id = {}
+    for ep in episodes:
+        episodes_by_id.setdefault(ep['id'], ep)
+    _upstream_episodes_cache.set(slug, (podcast_name, {
+        ep_id: {field: ep.get(field) for field in _UPSTREAM_EPISODE_FIELDS}
+        for ep_id, ep in episodes_by_id.items()
+    }))
+    return podcast_name, episodes_by_id
+
+
 def _lookup_episode(slug, episode_id, feed_map, episode_row=None):
-    """Fetch the RSS feed once and return episode data + podcast name.
+    """Resolve an episode from the upstream RSS feed; return episode data +
+    podcast name.
 
     Returns (episode_dict, podcast_name) or (None, None).
     episode_dict keys: url, title, description, artwork_url, published.
+    Tries, in order: the in-process parsed cache, the upstream body saved
+    by the last feed refresh, and a live fetch. A miss in either copy falls
+    through to the next, since the episode may have been published since.
     Falls back to database if episode is not in the upstream RSS feed.
     """
+    cached = _upstream_episodes_cache.get(slug)
+    if cached is not None:
+        ep = cached[1].get(episode_id)
+        if ep is not None:
+            episode = episode_row or db.get_episode(slug, episode_id)
+            return ({**ep, 'description': episode.get('description') if episode else None},
+                    cached[0])
+    else:
+        saved_feed = storage.get_original_rss(slug)
+        if saved_feed:
+            podcast_name, episodes_by_id = _index_upstream_feed(slug, saved_feed)
+            ep = episodes_by_id.get(episode_id)
+            if ep is not None:
+                return ep, podcast_name
+
     original_feed = rss_parser.fetch_feed(feed_map[slug]['in'])
     if original_feed:
-        parsed_feed = rss_parser.parse_feed(original_feed, source=slug)
-        podcast_name = parsed_feed.feed.get('title', 'Unknown') if parsed_feed else 'Unknown'
-        episodes = rss_parser.extract_episodes(
-            original_feed, parsed_feed=parsed_feed, source=slug)
-        for ep in episodes:
-            if ep['id'] == episode_id:
-                return ep, podcast_name
+        podcast_name, episodes_by_id = _index_upstream_feed(slug, original_feed)
+        ep = episodes_by_id.get(episode_id)
+        if ep is not None:
+            return ep, podcast_name
 
     # Fallback: episode not in upstream RSS (dropped off due to age/cap).
     # Use the original_url stored in the database from discovery.
@@ -225,8 +402,10 @@ def register_routes(app):
         safe_path = safe_join(str(STATIC_DIR), path) if path else None
 
         if path and path.startswith('assets/'):
-            if not safe_path or not os.path.isfile(safe_path):
-                return "Asset not found", 404
+            if path not in _known_assets:
+                if not safe_path or not os.path.isfile(safe_path):
+                    return "Asset not found", 404
+                _known_assets.add(path)
             response = send_from_directory(STATIC_DIR, path)
             response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
             return response
@@ -284,9 +463,7 @@ def register_routes(app):
             abort(404)
 
         # Check if RSS cache exists or is stale
-        cached_rss = storage.get_rss(slug)
-        data = storage.load_data_json(slug)
-        last_checked = data.get('last_checked')
+        cached_rss, rss_version = storage.get_rss_with_version(slug)
 
         should_refresh = False
         force_refresh = False  # Force full fetch bypasses 304 - use when cache is missing
@@ -325,13 +502,17 @@ def register_routes(app):
                         f"[{slug}] cached RSS feed-auth key state mismatch, "
                         f"forcing refresh"
                     )
-        if not should_refresh and last_checked:
+        # Only the podcast row's last_checked_at is needed here; a missing
+        # or mismatched cache refreshes regardless, so skip the lookup then.
+        last_checked = None
+        if not should_refresh:
+            last_checked = db.get_podcast_last_checked_at(slug)
+        if last_checked:
             try:
-                last_time = parse_iso_datetime(last_checked)
-                age_minutes = (datetime.now(timezone.utc) - last_time).total_seconds() / 60
-                if age_minutes > 15:
+                age_seconds = time.time() - _last_checked_epoch(last_checked)
+                if age_seconds > _RSS_FRESH_SECONDS:
                     should_refresh = True
-                    feed_logger.info(f"[{slug}] RSS cache stale ({age_minutes:.0f}min), refreshing")
+                    feed_logger.info(f"[{slug}] RSS cache stale ({age_seconds / 60:.0f}min), refreshing")
             except (ValueError, TypeError):
                 should_refresh = True
 
@@ -340,7 +521,7 @@ def register_routes(app):
                 # No serveable cache (missing, BASE_URL mismatch, or feed-key
                 # mismatch): the client must wait for the synchronous refresh.
                 refresh_rss_feed(slug, feed_map[slug]['in'], force=force_refresh)
-                cached_rss = storage.get_rss(slug)
+                cached_rss, rss_version = storage.get_rss_with_version(slug)
             else:
                 # Stale-while-revalidate: valid cached RSS exists, only the
                 # 15-min freshness window lapsed. Serve the cached bytes now
@@ -352,7 +533,7 @@ def register_routes(app):
 
         if cached_rss:
             feed_logger.info(f"[{slug}] Serving RSS feed")
-            return Response(cached_rss, mimetype='application/rss+xml')
+            return _rss_response(slug, cached_rss, rss_version)
         else:
             feed_logger.error(f"[{slug}] RSS feed not available")
             abort(503)
@@ -399,14 +580,16 @@ def register_routes(app):
             file_path = storage.get_episode_path(
                 slug, episode_id, version=serve_version
             )
-            if file_path.exists():
+            try:
+                response = _send_episode_audio(file_path)
+            except FileNotFoundError:
+                feed_logger.error(f"[{slug}:{episode_id}] Processed file missing")
+                status = None
+            else:
                 feed_logger.info(
                     f"[{slug}:{episode_id}] Cache hit (v={serve_version})"
                 )
-                return send_file(file_path, mimetype='audio/mpeg')
-            else:
-                feed_logger.error(f"[{slug}:{episode_id}] Processed file missing")
-                status = None
+                return response
 
         elif status == EpisodeStatus.PERMANENTLY_FAILED:
             ep_key = f"{slug}:{episode_id}"
@@ -548,7 +731,10 @@ def register_routes(app):
         # No credentials are involved; the endpoint carries no session.
         response = Response(vtt_content, mimetype='text/vtt')
         response.headers['Access-Control-Allow-Origin'] = '*'
-        return response
+        # Players refetch transcripts on every episode open; the ETag lets
+        # them revalidate with a 304 instead of pulling the body again.
+        response.add_etag()
+        return response.make_conditional(request)
 
     @app.route('/episodes/<slug>/<episode_id>/chapters.json')
     @validate_slug_and_episode_params
@@ -567,7 +753,8 @@ def register_routes(app):
         # is intentional. No credentials travel with the request.
         response = Response(json.dumps(chapters), mimetype='application/json+chapters')
         response.headers['Access-Control-Allow-Origin'] = '*'
-        return response
+        response.add_etag()
+        return response.make_conditional(request)
 
     @app.route('/opml/<mode>.opml')
     @log_request_detailed
@@ -423,6 +423,7 @@ class RSSParser:
                 max_redirects=HTTP_MAX_REDIRECTS_FEED,
                 stream=True,
                 headers=headers,
+                pooled=True,
             )
 
             if response.status_code == 304:
@@ -533,8 +534,10 @@ class RSSParser:
         """
         try:
             # Normalise to bytes for the pre-scan; feedparser accepts either.
+            # Only the scanned prefix is encoded: 64K characters encode to at
+            # least 64 KB, and a multi-megabyte feed need not be copied whole.
             if isinstance(feed_content, str):
-                header_bytes = feed_content.encode('utf-8', errors='ignore')
+                header_bytes = feed_content[:65536].encode('utf-8', errors='ignore')
             else:
                 header_bytes = feed_content
             # Scan the first 64 KB; legitimate feeds declare their prolog
@@ -325,29 +325,95 @@ class Storage:
             slug, episode_id, f"{episode_id}-original{extension}"
         )
 
-    def save_rss(self, slug: str, content: str) -> None:
-        """Save modified RSS feed to filesystem."""
-        podcast_dir = self.get_podcast_dir(slug)
-        rss_file = podcast_dir / "modified-rss.xml"
+    @staticmethod
+    def _write_text_if_changed(path: Path, content: str) -> bool:
+        """Atomically write ``content`` to ``path`` unless it already holds it.
+
+        Most refreshes of a quiet feed produce byte-identical XML; reading
+        the current copy back (usually from page cache) is far cheaper than
+        the temp-file write and rename. Compares against the file itself,
+        not an in-memory hash, so a copy written by another worker is
+        never mistaken for ours. Returns True when the file was written.
+        """
+        try:
+            # newline='' so CRLF feeds compare as written
+            with open(path, 'r', newline='') as f:
+                if f.read() == content:
+                    return False
+        except FileNotFoundError:
+            pass
 
         # Atomic write
         with tempfile.NamedTemporaryFile(mode='w', delete=False,
-                                         dir=podcast_dir, suffix='.tmp') as tmp:
+                                         dir=path.parent, suffix='.tmp') as tmp:
             tmp.write(content)
             tmp_path = tmp.name
 
-        shutil.move(tmp_path, rss_file)
-        logger.debug(f"[{slug}] Saved modified RSS feed")
+        shutil.move(tmp_path, path)
+        return True
+
+    def save_rss(self, slug: str, content: str) -> None:
+        """Save modified RSS feed to filesystem."""
+        podcast_dir = self.get_podcast_dir(slug)
+        if self._write_text_if_changed(podcast_dir / "modified-rss.xml", content):
+            logger.debug(f"[{slug}] Saved modified RSS feed")
+        else:
+            logger.debug(f"[{slug}] Modified RSS feed unchanged, write skipped")
 
     def get_rss(self, slug: str) -> Optional[str]:
         """Get cached RSS feed from filesystem."""
+        return self.get_rss_with_version(slug)[0]
+
+    def get_rss_with_version(self, slug: str) -> Tuple[Optional[str], Optional[tuple]]:
+        """Get cached RSS feed plus a version token for that exact copy.
+
+        The token is (inode, mtime_ns, size) from the open file, so it always
+        describes the bytes returned; save_rss replaces the file by rename, so
+        any rewrite yields a new token. Returns (None, None) when missing.
+        """
+        rss_file = self.get_podcast_dir(slug) / "modified-rss.xml"
+        try:
+            with open(rss_file, 'r') as f:
+                st = os.fstat(f.fileno())
+                return f.read(), (st.st_ino, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None, None
+
+    def save_original_rss(self, slug: str, content: str) -> None:
+        """Save the upstream RSS body from the last full refresh.
+
+        Lets episode requests resolve enclosure URLs without re-fetching the
+        upstream feed; see get_original_rss.
+        """
         podcast_dir = self.get_podcast_dir(slug)
-        rss_file = podcast_dir / "modified-rss.xml"
+        if self._write_text_if_changed(podcast_dir / "original-rss.xml", content):
+            logger.debug(f"[{slug}] Saved upstream RSS feed")
 
-        if rss_file.exists():
+    def get_original_rss(self, slug: str) -> Optional[str]:
+        """Get the upstream RSS body saved by the last full refresh.
+
+        Read-only: unlike get_rss this does not create the podcast
+        directory, since it is called with slugs straight from the URL.
+        """
+        rss_file = self._podcast_path(slug) / "original-rss.xml"
+        try:
             with open(rss_file, 'r') as f:
                 return f.read()
-        return None
+        except FileNotFoundError:
+            return None
+
+    def delete_original_rss(self, slug: str) -> bool:
+        """Drop the saved upstream body, for a feed repointed at a new source.
+
+        Until the next full refresh saves the new feed, episode lookups fall
+        through to a live fetch instead of resolving against the old XML.
+        """
+        try:
+            (self._podcast_path(slug) / "original-rss.xml").unlink()
+        except FileNotFoundError:
+            return False
+        logger.debug(f"[{slug}] Deleted saved upstream RSS feed")
+        return True
 
     def save_transcript(self, slug: str, episode_id: str, transcript: str) -> None:
         """Save episode transcript to database."""
@@ -641,41 +707,46 @@ class Storage:
                     timeout=HTTP_TIMEOUT_FETCH,
                     stream=True,
                     headers=headers,
+                    pooled=True,
                 )
             except SSRFError as e:
                 logger.warning(
                     f"[{slug}:{episode_id}] SSRF blocked in "
                     f"download_episode_artwork: {e}")
                 return False
-            response.raise_for_status()
-
-            declared_type = (response.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
-            if declared_type and declared_type not in _ALLOWED_IMAGE_TYPES:
-                logger.warning(
-                    "[%s:%s] episode_artwork_rejected_content_type declared=%s url=%s",
-                    slug, episode_id, declared_type, artwork_url,
-                )
-                return False
-
-            max_bytes = _max_artwork_bytes()
             try:
-                image_data = read_response_capped(response, max_bytes, chunk_size=65536)
-            except ResponseTooLargeError:
-                logger.warning(
-                    "[%s:%s] episode_artwork_size_cap_exceeded max=%d url=%s",
-                    slug, episode_id, max_bytes, artwork_url,
-                )
-                return False
+                response.raise_for_status()
 
-            detected = _detect_image_mime(image_data)
-            if not detected:
-                logger.warning(
-                    "[%s:%s] episode_artwork_rejected_magic declared=%s url=%s",
-                    slug, episode_id, declared_type, artwork_url,
-                )
-                return False
+                declared_type = (response.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
+                if declared_type and declared_type not in _ALLOWED_IMAGE_TYPES:
+                    logger.warning(
+                        "[%s:%s] episode_artwork_rejected_content_type declared=%s url=%s",
+                        slug, episode_id, declared_type, artwork_url,
+                    )
+                    return False
 
-            return self._save_episode_artwork(slug, episode_id, image_data, detected)
+                max_bytes = _max_artwork_bytes()
+                try:
+                    image_data = read_response_capped(response, max_bytes, chunk_size=65536)
+                except ResponseTooLargeError:
+                    logger.warning(
+                        "[%s:%s] episode_artwork_size_cap_exceeded max=%d url=%s",
+                        slug, episode_id, max_bytes, artwork_url,
+                    )
+                    return False
+
+                detected = _detect_image_mime(image_data)
+                if not detected:
+                    logger.warning(
+                        "[%s:%s] episode_artwork_rejected_magic declared=%s url=%s",
+                        slug, episode_id, declared_type, artwork_url,
+                    )
+                    return False
+
+                return self._save_episode_artwork(slug, episode_id, image_data, detected)
+            finally:
+                # Hands the keep-alive connection back to the pool on every exit.
+                response.close()
 
         except Exception as e:
             logger.warning(
@@ -899,39 +970,44 @@ class Storage:
                     timeout=HTTP_TIMEOUT_FETCH,
                     stream=True,
                     headers=headers,
+                    pooled=True,
                 )
             except SSRFError as e:
                 logger.warning(f"[{slug}] SSRF blocked in download_artwork: {e}")
                 return False
-            response.raise_for_status()
-
-            declared_type = (response.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
-            if declared_type and declared_type not in _ALLOWED_IMAGE_TYPES:
-                logger.warning(
-                    "[%s] artwork_rejected_content_type declared=%s url=%s",
-                    slug, declared_type, artwork_url,
-                )
-                return False
-
-            max_bytes = _max_artwork_bytes()
             try:
-                image_data = read_response_capped(response, max_bytes, chunk_size=65536)
-            except ResponseTooLargeError:
-                logger.warning(
-                    "[%s] artwork_size_cap_exceeded max=%d url=%s",
-                    slug, max_bytes, artwork_url,
-                )
-                return False
+                response.raise_for_status()
 
-            detected = _detect_image_mime(image_data)
-            if not detected:
-                logger.warning(
-                    "[%s] artwork_rejected_magic declared=%s url=%s",
-                    slug, declared_type, artwork_url,
-                )
-                return False
+                declared_type = (response.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
+                if declared_type and declared_type not in _ALLOWED_IMAGE_TYPES:
+                    logger.warning(
+                        "[%s] artwork_rejected_content_type declared=%s url=%s",
+                        slug, declared_type, artwork_url,
+                    )
+                    return False
 
-            return self.save_artwork(slug, image_data, detected, artwork_url)
+                max_bytes = _max_artwork_bytes()
+                try:
+                    image_data = read_response_capped(response, max_bytes, chunk_size=65536)
+                except ResponseTooLargeError:
+                    logger.warning(
+                        "[%s] artwork_size_cap_exceeded max=%d url=%s",
+                        slug, max_bytes, artwork_url,
+                    )
+                    return False
+
+                detected = _detect_image_mime(image_data)
+                if not detected:
+                    logger.warning(
+                        "[%s] artwork_rejected_magic declared=%s url=%s",
+                        slug, declared_type, artwork_url,
+                    )
+                    return False
+
+                return self.save_artwork(slug, image_data, detected, artwork_url)
+            finally:
+                # Hands the keep-alive connection back to the pool on every exit.
+                response.close()
 
         except Exception as e:
             logger.warning(f"[{slug}] Failed to download artwork: {e}")
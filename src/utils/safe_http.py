@@ -25,12 +25,15 @@ before any bytes hit the wire.
 from __future__ import annotations
 
 import enum
+import http.cookiejar
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Optional, Protocol
 from urllib.parse import urlparse
 
 import requests
+import requests.adapters
 
 from config import HTTP_MAX_REDIRECTS_API, HTTP_TIMEOUT_API, HTTP_TIMEOUT_FETCH
 from utils.url import SSRFError, validate_base_url, validate_url
@@ -160,6 +163,49 @@ class _RevalidatingSession(requests.Session):
                 prepared_request.headers.pop(header, None)
 
 
+# Shared keep-alive sessions, one per (trust, max_redirects). They live at
+# module level so a connection opened by one refresh cycle's worker is still
+# in the pool for the next cycle's; the urllib3 pool underneath is
+# thread-safe and these sessions hold no per-request state.
+_POOL_MAXSIZE = 10
+_pooled_sessions: dict[tuple[URLTrust, int], _RevalidatingSession] = {}
+_pooled_lock = threading.Lock()
+
+
+def _pooled_session(trust: URLTrust, max_redirects: int) -> _RevalidatingSession:
+    """Process-wide keep-alive session for repeated fetches (feed refresh).
+
+    The cookie jar refuses every cookie so one feed host cannot set state that
+    rides along to the next.
+    """
+    key = (trust, max_redirects)
+    with _pooled_lock:
+        session = _pooled_sessions.get(key)
+        if session is None:
+            session = _RevalidatingSession(trust, max_redirects)
+            session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _pooled_sessions[key] = session
+        return session
+
+
+def close_pooled_sessions() -> None:
+    """Close the shared keep-alive sessions (worker shutdown).
+
+    A later pooled fetch opens a fresh session.
+    """
+    with _pooled_lock:
+        sessions = list(_pooled_sessions.values())
+        _pooled_sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception as exc:
+            logger.debug("pooled session close failed: %s", exc)
+
+
 def safe_get(
     url: str,
     trust: URLTrust,
@@ -168,14 +214,20 @@ def safe_get(
     timeout: float = HTTP_TIMEOUT_FETCH,
     stream: bool = False,
     headers: Optional[dict] = None,
+    pooled: bool = False,
 ) -> requests.Response:
     """GET ``url`` via a session that revalidates every redirect hop.
 
     Raises ``SSRFError`` for disallowed URLs (initial or redirect targets)
     and ``requests.RequestException`` for network errors. Callers apply
     ``read_response_capped`` on the returned response to enforce size.
+    With ``pooled=True`` the request goes through the shared keep-alive
+    session so repeat fetches to the same host reuse the TCP/TLS connection.
     """
     _validate_for_tier(url, trust)
+    if pooled:
+        return _pooled_session(trust, max_redirects).get(
+            url, timeout=timeout, stream=stream, headers=headers)
     session = _RevalidatingSession(trust, max_redirects)
     try:
         return session.get(url, timeout=timeout, stream=stream, headers=headers)
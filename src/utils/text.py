@@ -15,6 +15,11 @@ from utils.time import parse_timestamp
 # moved to segment edges; this only measures proximity.
 BOUNDARY_SNAP_TOLERANCE_S = 3.0
 
+# One transcript line: "[start --> end] text". The time groups exclude ']'
+# so the first "] " ends the range, and brackets hugging the range are
+# dropped, matching the old line.split('] ', 1) + strip('[') parse.
+_SEGMENT_LINE_RE = re.compile(r'^\[+([^\]\n]*?) --> ([^\]\n]*?)\[*\] (.*)$', re.MULTILINE)
+
 
 def truncate(text: str, limit: int) -> str:
     """Cut text to limit characters, ellipsis included in the count."""
@@ -39,22 +44,31 @@ def parse_transcript_segments(transcript_text: str) -> List[dict]:
         List of dicts with 'start', 'end', 'text' keys
     """
     segments: List[dict] = []
-    for line in transcript_text.split('\n'):
-        if line.strip() and line.startswith('['):
-            try:
-                time_part, text_part = line.split('] ', 1)
-                time_range = time_part.strip('[')
-                start_str, end_str = time_range.split(' --> ')
-                segments.append({
-                    'start': parse_timestamp(start_str),
-                    'end': parse_timestamp(end_str),
-                    'text': text_part,
-                })
-            except (ValueError, TypeError):
-                continue
+    for match in _SEGMENT_LINE_RE.finditer(transcript_text):
+        try:
+            segments.append({
+                'start': _segment_time(match[1]),
+                'end': _segment_time(match[2]),
+                'text': match[3],
+            })
+        except (ValueError, TypeError):
+            continue
     return segments
 
 
+def _segment_time(raw: str) -> float:
+    """HH:MM:SS.mmm to seconds, deferring anything else to parse_timestamp.
+
+    Transcripts are written in that one format, so the direct split skips
+    parse_timestamp's normalization and float() probe on every line.
+    """
+    try:
+        hours, minutes, seconds = raw.split(':')
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except ValueError:
+        return parse_timestamp(raw)
+
+
 def get_transcript_text_for_range(
     segments: List[dict],
     start_time: float,
@@ -25,6 +25,11 @@ _route_logger = logging.getLogger(__name__)
 # obvious abuse, not to gate legitimate slugs.
 SLUG_RE: Final = re.compile(r"^[a-z0-9][a-z0-9-]{0,199}$")
 EPISODE_ID_RE: Final = re.compile(r"^[a-f0-9]{12}$")
+# fullmatch, not match: ``$`` also matches before a trailing newline, so
+# match() let ``<id>%0A`` through. Bound once since the episode check runs
+# on every audio, transcript and chapters request.
+_slug_fullmatch: Final = SLUG_RE.fullmatch
+_episode_id_fullmatch: Final = EPISODE_ID_RE.fullmatch
 
 RESERVED_SLUGS: Final = frozenset(
     {
@@ -57,14 +62,14 @@ def is_valid_slug(value: str) -> bool:
         return False
     if value in RESERVED_SLUGS:
         return False
-    return bool(SLUG_RE.match(value))
+    return _slug_fullmatch(value) is not None
 
 
 def is_valid_episode_id(value: str) -> bool:
     # Real episode IDs are 12-char MD5 hex prefixes; the shape is load-bearing.
     if not isinstance(value, str):
         return False
-    return bool(EPISODE_ID_RE.match(value))
+    return _episode_id_fullmatch(value) is not None
 
 
 def is_dangerous_slug(value: str) -> bool:
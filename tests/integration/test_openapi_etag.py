@@ -0,0 +1,31 @@
+"""/api/v1/openapi.yaml carries an ETag and answers revalidation with 304."""
+import pytest
+
+from tests.app_bootstrap import bootstrap
+
+_test_data_dir = bootstrap('openapi_etag_test_')
+
+from main_app import app
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as c:
+        # Authenticated so the result does not depend on whether an earlier
+        # module left an app password configured.
+        with c.session_transaction() as sess:
+            sess['authenticated'] = True
+        yield c
+
+
+def test_openapi_sets_etag_and_revalidates(client):
+    first = client.get('/api/v1/openapi.yaml')
+    assert first.status_code == 200
+    etag = first.headers.get('ETag')
+    assert etag
+
+    second = client.get('/api/v1/openapi.yaml',
+                        headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
@@ -0,0 +1,118 @@
+"""serve_rss pre-gzips feed XML for gzip-only podcast clients."""
+import gzip
+
+import pytest
+
+from tests.app_bootstrap import bootstrap
+
+_test_data_dir = bootstrap('rss_gzip_test_')
+
+import database
+from main_app import app, db as app_db
+import main_app.feeds as feeds_mod
+import main_app.routes as routes_mod
+
+SLUG = 'gzip-feed'
+RSS = ('<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>'
+       '<title>T</title>' + '<item><title>Episode</title></item>' * 40
+       + '</channel></rss>')
+
+
+@pytest.fixture(autouse=True)
+def _seeded():
+    prev = database.Database._instance
+    database.Database._instance = app_db
+    app_db.set_setting('app_password', '')
+    app_db.set_setting('feed_auth_enabled', 'false', is_default=False)
+    if not app_db.get_podcast_by_slug(SLUG):
+        app_db.create_podcast(SLUG, f'https://example.com/{SLUG}.xml', SLUG)
+    routes_mod.storage.save_rss(SLUG, RSS)
+    feeds_mod.invalidate_feed_cache()
+    routes_mod._rss_gzip_cache.invalidate()
+    routes_mod._rss_etag_cache.invalidate()
+    yield
+    database.Database._instance = prev
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as c:
+        yield c
+
+
+def test_gzip_only_client_gets_pregzipped_feed(client):
+    resp = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    assert resp.status_code == 200
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in resp.headers['Vary']
+    assert gzip.decompress(resp.get_data()).decode() == RSS
+
+
+def test_gzipped_body_reused_until_feed_changes(client):
+    client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    first = routes_mod._rss_gzip_cache.get(SLUG)[1]
+    client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    assert routes_mod._rss_gzip_cache.get(SLUG)[1] is first
+
+    changed = RSS.replace('<title>T</title>', '<title>T2</title>')
+    routes_mod.storage.save_rss(SLUG, changed)
+    resp = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    assert gzip.decompress(resp.get_data()).decode() == changed
+
+
+def test_gzip_entry_does_not_keep_the_feed_text(client):
+    """A multi-MB feed must not sit in this cache a second time as text."""
+    client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    key, body = routes_mod._rss_gzip_cache.get(SLUG)
+    assert key == routes_mod._rss_etag_cache.get(SLUG)[1]
+    assert isinstance(body, bytes)
+
+
+def test_identity_client_gets_plain_xml(client):
+    resp = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in resp.headers
+    assert resp.get_data(as_text=True) == RSS
+
+
+def test_brotli_client_left_to_flask_compress(client):
+    resp = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip, br'})
+    assert resp.headers.get('Content-Encoding') != 'gzip'
+    assert routes_mod._rss_gzip_cache.get(SLUG) is None
+
+
+def test_feed_revalidates_with_etag(client):
+    first = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'identity'})
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control'] == 'public, max-age=60'
+
+    resp = client.get(f'/{SLUG}', headers={
+        'Accept-Encoding': 'identity', 'If-None-Match': etag,
+    })
+    assert resp.status_code == 304
+    assert resp.get_data() == b''
+
+    routes_mod.storage.save_rss(SLUG, RSS.replace('<title>T</title>', '<title>T2</title>'))
+    resp = client.get(f'/{SLUG}', headers={
+        'Accept-Encoding': 'identity', 'If-None-Match': etag,
+    })
+    assert resp.status_code == 200
+    assert resp.headers['ETag'] != etag
+
+
+def test_etag_entry_does_not_keep_the_feed_text(client):
+    client.get(f'/{SLUG}', headers={'Accept-Encoding': 'identity'})
+    version, etag = routes_mod._rss_etag_cache.get(SLUG)
+    assert version == routes_mod.storage.get_rss_with_version(SLUG)[1]
+    assert isinstance(etag, str) and len(etag) == 24
+
+
+def test_gzip_etag_is_encoding_specific(client):
+    plain = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'identity'})
+    gz = client.get(f'/{SLUG}', headers={'Accept-Encoding': 'gzip'})
+    assert gz.headers['ETag'] == plain.headers['ETag'][:-1] + ':gzip"'
+
+    resp = client.get(f'/{SLUG}', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': gz.headers['ETag'],
+    })
+    assert resp.status_code == 304
@@ -155,3 +155,18 @@ def test_download_rejects_disallowed_content_type(temp_db, tmp_path):
         result = storage.download_artwork('svg-pod', 'https://cdn.example.com/x.svg')
 
     assert result is False
+
+
+def test_download_uses_pooled_session_and_releases_connection(temp_db, tmp_path):
+    """Rejected artwork still closes the response so the keep-alive
+    connection goes back to the shared pool."""
+    from storage import Storage
+    storage = Storage(data_dir=str(tmp_path))
+    storage.db.create_podcast('pool-pod', 'https://example.com/feed.xml')
+
+    response = _mock_response('image/svg+xml', b'<svg></svg>')
+    with patch('storage.safe_get', return_value=response) as mock_get:
+        assert storage.download_artwork('pool-pod', 'https://cdn.example.com/x.svg') is False
+
+    assert mock_get.call_args.kwargs['pooled'] is True
+    response.close.assert_called_once()
@@ -358,3 +358,62 @@ def test_markers_not_passed_when_upstream_json_preserved(monkeypatch):
 
     fetch_mock.assert_called_once()
     generator_class.return_value.generate_chapters.assert_not_called()
+
+
+# ---------- transcript / chapter overlap ----------
+
+def _recording_db(chapters_mode, vtt_error=None):
+    """_db whose get_setting records the thread each key is read on."""
+    import threading
+
+    db = _db(chapters_mode=chapters_mode)
+    base = db.get_setting.side_effect
+    threads = {}
+
+    def get_setting(key):
+        threads[key] = threading.current_thread()
+        if key == 'vtt_transcripts_enabled' and vtt_error:
+            raise vtt_error
+        return base(key)
+
+    db.get_setting.side_effect = get_setting
+    return db, threads
+
+
+def test_transcript_assets_run_off_thread_alongside_chapters(monkeypatch):
+    """The transcript half runs on the asset pool while chapters run inline."""
+    import threading
+
+    db, threads = _recording_db('generate')
+    storage_mock, _, generator_class, _, _ = _run(monkeypatch, db, [])
+
+    assert threads['chapters_enabled'] is threading.current_thread()
+    assert threads['vtt_transcripts_enabled'] is not threading.current_thread()
+    storage_mock.save_final_segments.assert_called_once()
+    generator_class.return_value.generate_chapters.assert_called_once()
+
+
+def test_transcript_failure_does_not_skip_chapters(monkeypatch):
+    db, _ = _recording_db('generate', vtt_error=RuntimeError('db locked'))
+
+    storage_mock, _, generator_class, _, _ = _run(monkeypatch, db, [])
+
+    storage_mock.save_final_segments.assert_not_called()
+    generator_class.return_value.generate_chapters.assert_called_once()
+    storage_mock.save_chapters_and_applied_cuts.assert_called_once()
+    db.clear_leaked_transaction.assert_called_once()
+
+
+def test_both_asset_failures_are_logged(monkeypatch, caplog):
+    """A chapter failure is reported even when the transcript half fails too."""
+    import logging
+
+    db, _ = _recording_db('generate', vtt_error=RuntimeError('db locked'))
+    db.get_podcast_by_slug.side_effect = RuntimeError('chapters broke')
+
+    with caplog.at_level(logging.WARNING, logger='podcast.audio'):
+        _run(monkeypatch, db, [])
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert any('Failed to generate chapters: chapters broke' in m for m in messages)
+    assert any('Failed to generate transcript: db locked' in m for m in messages)
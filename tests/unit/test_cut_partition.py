@@ -182,7 +182,7 @@ def _run_pipeline(first_pass_ads, segment_actions):
         audio_processor_mod.get_audio_duration.return_value = 100.0
         local_ap = local_ap_cls.return_value
         local_ap.process_episode.side_effect = (
-            lambda audio_path, segs: ('/tmp/cutpart-cut.mp3', list(segs)))
+            lambda audio_path, segs, output_dir=None: ('/tmp/cutpart-cut.mp3', list(segs)))
         local_ap.get_audio_duration.return_value = 100.0
         storage.get_episode_path.return_value = '/tmp/cutpart-final.mp3'
 
@@ -326,7 +326,7 @@ class TestProcessEpisodeCallSiteUniformity:
 
     def test_every_call_site_passes_audio_segments(self):
         source = inspect.getsource(processing)
-        calls = re.findall(r'\.process_episode\(\s*[^,]+,\s*(\w+)\)', source)
+        calls = re.findall(r'\.process_episode\(\s*[^,]+,\s*(\w+)\s*[,)]', source)
         assert len(calls) >= 3, (
             f"expected at least the pass-1, pass-2-recut, and recut-mode "
             f"call sites, found {calls}")
@@ -99,6 +99,17 @@ class TestPodcastOperations:
         assert podcast['title'] == 'Updated Title'
         assert podcast['description'] == 'New description'
 
+    def test_get_podcast_last_checked_at(self, temp_db):
+        """The RSS freshness check reads the one column, not the aggregate row."""
+        slug = 'checked-test'
+        temp_db.create_podcast(slug, 'https://example.com/feed.xml')
+        assert temp_db.get_podcast_last_checked_at(slug) is None
+
+        temp_db.update_podcast(slug, last_checked_at='2026-03-15T12:00:00Z')
+
+        assert temp_db.get_podcast_last_checked_at(slug) == '2026-03-15T12:00:00Z'
+        assert temp_db.get_podcast_last_checked_at('missing-slug') is None
+
     def test_delete_podcast_cascade(self, temp_db):
         """Deleting podcast should cascade to episodes."""
         slug = 'delete-test'
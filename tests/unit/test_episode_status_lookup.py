@@ -0,0 +1,17 @@
+"""Tests for the status-only episode lookup used by the queue waiter."""
+
+
+def test_returns_status_of_existing_episode(temp_db):
+    temp_db.create_podcast('status-feed', 'https://example.com/s.xml', 'Status Feed')
+    temp_db.upsert_episode(slug='status-feed', episode_id='abcdef012345',
+                           title='ep', original_url='https://example.com/a.mp3',
+                           status='processing')
+
+    assert temp_db.get_episode_status('status-feed', 'abcdef012345') == 'processing'
+
+
+def test_missing_episode_or_feed_is_none(temp_db):
+    temp_db.create_podcast('status-feed', 'https://example.com/s.xml', 'Status Feed')
+
+    assert temp_db.get_episode_status('status-feed', 'abcdef012345') is None
+    assert temp_db.get_episode_status('no-such-feed', 'abcdef012345') is None
@@ -0,0 +1,33 @@
+"""Tests for the single-parse pubDate helper in the auto-process loop."""
+from datetime import timezone
+
+import pytest
+
+from tests.app_bootstrap import bootstrap
+
+bootstrap('feed_published_parse_test_')
+from database.episodes import normalize_published_at
+from main_app.feeds import _parse_published
+
+
+@pytest.mark.parametrize('published', [
+    'Tue, 10 Mar 2026 19:10:06 PDT',
+    'Tue, 10 Mar 2026 19:10:06',
+    '10 Mar 2026 19:10:06 +0000',
+    '2026-03-10T19:10:06Z',
+    'not a date',
+    '',
+])
+def test_dedup_key_matches_normalize_published_at(published):
+    iso_published, _ = _parse_published(published)
+    assert iso_published == (normalize_published_at(published) or None)
+
+
+def test_rfc2822_date_is_tz_aware():
+    _, pub_date = _parse_published('Tue, 10 Mar 2026 19:10:06')
+    assert pub_date.tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize('published', ['2026-03-10T19:10:06Z', 'not a date', ''])
+def test_non_rfc2822_value_is_never_recent(published):
+    assert _parse_published(published)[1] is None
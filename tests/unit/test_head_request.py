@@ -14,7 +14,7 @@ from tests.app_bootstrap import bootstrap
 
 _test_data_dir = bootstrap('head_test_')
 from main_app import app
-from main_app.routes import _head_upstream, _lookup_episode
+from main_app.routes import _head_upstream, _lookup_episode, _upstream_episodes_cache
 
 
 @pytest.fixture
@@ -123,6 +123,54 @@ class TestHeadRequestProcessedEpisode:
         assert resp.content_length > 0
 
 
+class TestAccelRedirect:
+    """MINUSPOD_ACCEL_REDIRECT_PREFIX hands processed MP3s to nginx."""
+
+    @patch('main_app.routes._ACCEL_REDIRECT_PREFIX', '/_minuspod_data')
+    @patch('main_app.routes.storage')
+    @patch('main_app.routes.db')
+    @patch('main_app.routes.get_feed_map')
+    def test_processed_episode_emits_accel_redirect(
+        self, mock_feed_map, mock_db, mock_storage,
+        client, feed_map, tmp_path,
+    ):
+        mock_feed_map.return_value = feed_map
+        mock_db.get_episode.return_value = {'status': 'processed'}
+        fake_mp3 = tmp_path / 'podcasts' / 'test-pod' / 'episodes' / 'ep.mp3'
+        fake_mp3.parent.mkdir(parents=True)
+        fake_mp3.write_bytes(b'\xff\xfb\x90\x00' * 10)
+        mock_storage.data_dir = tmp_path
+        mock_storage.get_episode_path.return_value = fake_mp3
+
+        resp = client.get('/episodes/test-pod/abc123def456.mp3')
+
+        assert resp.status_code == 200
+        assert resp.headers['X-Accel-Redirect'] == (
+            '/_minuspod_data/podcasts/test-pod/episodes/ep.mp3'
+        )
+        assert resp.mimetype == 'audio/mpeg'
+        assert resp.data == b''
+
+    @patch('main_app.routes._ACCEL_REDIRECT_PREFIX', '/_minuspod_data')
+    @patch('main_app.routes._lookup_episode', return_value=(None, None))
+    @patch('main_app.routes.storage')
+    @patch('main_app.routes.db')
+    @patch('main_app.routes.get_feed_map')
+    def test_missing_file_is_not_redirected(
+        self, mock_feed_map, mock_db, mock_storage, mock_lookup,
+        client, feed_map, tmp_path,
+    ):
+        mock_feed_map.return_value = feed_map
+        mock_db.get_episode.return_value = {'status': 'processed'}
+        mock_storage.data_dir = tmp_path
+        mock_storage.get_episode_path.return_value = tmp_path / 'gone.mp3'
+
+        resp = client.get('/episodes/test-pod/abc123def456.mp3')
+
+        assert 'X-Accel-Redirect' not in resp.headers
+        assert resp.status_code == 404
+
+
 class TestGetRequestStillProcesses:
     """GET requests should still trigger JIT processing as before."""
 
@@ -180,6 +228,12 @@ class TestHeadUpstreamHelper:
 class TestLookupEpisode:
     """Test _lookup_episode helper."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_upstream_cache(self):
+        _upstream_episodes_cache.invalidate()
+        yield
+        _upstream_episodes_cache.invalidate()
+
     @patch('main_app.routes.rss_parser')
     def test_returns_episode_and_podcast_name(self, mock_rss):
         mock_rss.fetch_feed.return_value = '<rss></rss>'
@@ -224,6 +278,106 @@ class TestLookupEpisode:
         assert ep_data is None
         assert podcast_name is None
 
+    @patch('main_app.routes.rss_parser')
+    def test_reuses_parsed_feed_across_lookups(self, mock_rss):
+        mock_rss.fetch_feed.return_value = '<rss></rss>'
+        mock_parsed = MagicMock()
+        mock_parsed.feed.get.return_value = 'My Podcast'
+        mock_rss.parse_feed.return_value = mock_parsed
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'ep1', 'url': 'https://example.com/ep1.mp3'},
+            {'id': 'ep2', 'url': 'https://example.com/ep2.mp3'},
+        ]
+
+        feed_map = {'pod': {'in': 'https://example.com/feed.xml'}}
+        _lookup_episode('pod', 'ep1', feed_map)
+        ep_data, podcast_name = _lookup_episode('pod', 'ep2', feed_map)
+
+        assert ep_data['url'] == 'https://example.com/ep2.mp3'
+        assert podcast_name == 'My Podcast'
+        assert mock_rss.fetch_feed.call_count == 1
+
+    @patch('main_app.routes.rss_parser')
+    def test_refetches_when_episode_missing_from_cached_feed(self, mock_rss):
+        mock_rss.fetch_feed.return_value = '<rss></rss>'
+        mock_parsed = MagicMock()
+        mock_parsed.feed.get.return_value = 'My Podcast'
+        mock_rss.parse_feed.return_value = mock_parsed
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'ep1', 'url': 'https://example.com/ep1.mp3'},
+        ]
+
+        feed_map = {'pod': {'in': 'https://example.com/feed.xml'}}
+        _lookup_episode('pod', 'ep1', feed_map)
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'new', 'url': 'https://example.com/new.mp3'},
+            {'id': 'ep1', 'url': 'https://example.com/ep1.mp3'},
+        ]
+        ep_data, _ = _lookup_episode('pod', 'new', feed_map)
+
+        assert ep_data['url'] == 'https://example.com/new.mp3'
+        assert mock_rss.fetch_feed.call_count == 2
+
+    @patch('main_app.routes.storage')
+    @patch('main_app.routes.rss_parser')
+    def test_uses_upstream_body_saved_by_refresh(self, mock_rss, mock_storage):
+        mock_storage.get_original_rss.return_value = '<rss>saved</rss>'
+        mock_parsed = MagicMock()
+        mock_parsed.feed.get.return_value = 'My Podcast'
+        mock_rss.parse_feed.return_value = mock_parsed
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'ep1', 'url': 'https://example.com/ep1.mp3'},
+        ]
+
+        feed_map = {'pod': {'in': 'https://example.com/feed.xml'}}
+        ep_data, podcast_name = _lookup_episode('pod', 'ep1', feed_map)
+
+        assert ep_data['url'] == 'https://example.com/ep1.mp3'
+        assert podcast_name == 'My Podcast'
+        mock_rss.fetch_feed.assert_not_called()
+        mock_rss.parse_feed.assert_called_once_with('<rss>saved</rss>', source='pod')
+
+    @patch('main_app.routes.rss_parser')
+    def test_cache_keeps_slim_episodes_and_reads_description_from_row(self, mock_rss):
+        mock_rss.fetch_feed.return_value = '<rss></rss>'
+        mock_parsed = MagicMock()
+        mock_parsed.feed.get.return_value = 'My Podcast'
+        mock_rss.parse_feed.return_value = mock_parsed
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'ep1', 'url': 'https://example.com/ep1.mp3', 'title': 'Ep 1',
+             'description': 'x' * 10_000},
+        ]
+
+        feed_map = {'pod': {'in': 'https://example.com/feed.xml'}}
+        first, _ = _lookup_episode('pod', 'ep1', feed_map)
+        assert first['description'] == 'x' * 10_000
+        assert 'description' not in _upstream_episodes_cache.get('pod')[1]['ep1']
+
+        ep_data, _ = _lookup_episode('pod', 'ep1', feed_map,
+                                     episode_row={'description': 'from row'})
+
+        assert ep_data['url'] == 'https://example.com/ep1.mp3'
+        assert ep_data['description'] == 'from row'
+        assert mock_rss.fetch_feed.call_count == 1
+
+    @patch('main_app.routes.rss_parser')
+    def test_feed_update_evicts_the_cached_upstream(self, mock_rss):
+        from main_app.feeds import invalidate_feed_cache
+
+        mock_rss.fetch_feed.return_value = '<rss></rss>'
+        mock_parsed = MagicMock()
+        mock_parsed.feed.get.return_value = 'My Podcast'
+        mock_rss.parse_feed.return_value = mock_parsed
+        mock_rss.extract_episodes.return_value = [
+            {'id': 'ep1', 'url': 'https://old.example.com/ep1.mp3'},
+        ]
+        feed_map = {'pod': {'in': 'https://old.example.com/feed.xml'}}
+        _lookup_episode('pod', 'ep1', feed_map)
+
+        invalidate_feed_cache('pod')
+
+        assert _upstream_episodes_cache.get('pod') is None
+
 
 class TestJITRetryCooldown:
     """JIT route should respect cooldown between retries for failed episodes."""
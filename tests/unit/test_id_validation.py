@@ -0,0 +1,27 @@
+"""Tests for the strict slug / episode ID validators in utils.validation."""
+import pytest
+
+from utils.validation import is_valid_episode_id, is_valid_slug
+
+
+@pytest.mark.parametrize('value', ['abcdef012345', '0123456789ab'])
+def test_episode_id_accepts_md5_hex_prefix(value):
+    assert is_valid_episode_id(value) is True
+
+
+@pytest.mark.parametrize('value', [
+    'abcdef012345\n',        # $ alone would match before a trailing newline
+    'ABCDEF012345',
+    'abcdef01234',
+    'abcdef0123456',
+    'abcdef01234١',     # Arabic-Indic digit
+    '',
+    None,
+])
+def test_episode_id_rejects_wrong_shape(value):
+    assert is_valid_episode_id(value) is False
+
+
+def test_slug_rejects_trailing_newline():
+    assert is_valid_slug('a-show') is True
+    assert is_valid_slug('a-show\n') is False
@@ -0,0 +1,30 @@
+"""Tests for the LOG_FORMAT=json formatter."""
+import json
+import logging
+import os
+
+from main_app import JSONFormatter
+
+
+def _record(**extra):
+    record = logging.LogRecord('podcast.audio', logging.INFO, __file__, 1,
+                               'hello %s', ('world',), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_core_fields():
+    data = json.loads(JSONFormatter().format(_record()))
+    assert data['message'] == 'hello world'
+    assert data['level'] == 'INFO'
+    assert data['logger'] == 'podcast.audio'
+    assert data['pid'] == os.getpid()
+    assert 'slug' not in data
+
+
+def test_context_fields_copied_when_set():
+    data = json.loads(JSONFormatter().format(
+        _record(slug='a-show', episode_id='abcdef012345', request_id=None)))
+    assert data['slug'] == 'a-show'
+    assert data['episode_id'] == 'abcdef012345'
+    assert 'request_id' not in data
@@ -119,7 +119,7 @@ def _run_pipeline(first_pass_ads, segment_actions, late_synthesized_ad=None,
         audio_processor.get_audio_duration.return_value = 100.0
         local_ap = local_ap_cls.return_value
         local_ap.process_episode.side_effect = (
-            lambda audio_path, ads_to_remove: ('/tmp/cut.mp3', list(ads_to_remove)))
+            lambda audio_path, ads_to_remove, output_dir=None: ('/tmp/cut.mp3', list(ads_to_remove)))
         local_ap.get_audio_duration.return_value = 100.0
         storage.get_episode_path.return_value = '/tmp/final.mp3'
 
@@ -0,0 +1,140 @@
+"""Tests for run_cleanup's orphan podcast directory removal."""
+import os
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.app_bootstrap import bootstrap
+
+_test_data_dir = bootstrap('orphan_cleanup_test_')
+
+import main_app.background as background_module
+
+
+def _make_podcast_dirs(base, slugs):
+    for slug in slugs:
+        path = base / 'podcasts' / slug / 'episodes'
+        path.mkdir(parents=True)
+        (path / 'ep.mp3').write_bytes(b'\x00' * 16)
+
+
+@pytest.fixture
+def cleanup_env(tmp_path, monkeypatch):
+    """run_cleanup wired to a fake db and a storage rooted at tmp_path,
+    with the index rebuild stamped as just done. Returns the fake db."""
+    fake_db = MagicMock()
+    fake_db.cleanup_old_episodes.return_value = (0, 0.0)
+    fake_db.get_podcast_feed_urls.return_value = []
+    monkeypatch.setattr(background_module, 'db', fake_db)
+    monkeypatch.setattr(background_module, 'storage',
+                        SimpleNamespace(data_dir=str(tmp_path)))
+    monkeypatch.setattr(background_module.run_cleanup, '_last_index_rebuild',
+                        time.time(), raising=False)
+    return fake_db
+
+
+def test_removes_only_orphan_directories(tmp_path, cleanup_env):
+    _make_podcast_dirs(tmp_path, ['kept', 'orphan-a', 'orphan-b', 'orphan-c'])
+    (tmp_path / 'podcasts' / 'stray.txt').write_text('not a dir')
+
+    cleanup_env.get_podcast_feed_urls.return_value = [{'slug': 'kept'}]
+
+    background_module.run_cleanup()
+
+    remaining = sorted(os.listdir(tmp_path / 'podcasts'))
+    assert remaining == ['kept', 'stray.txt']
+
+
+def test_symlinked_directory_is_left_alone(tmp_path, cleanup_env):
+    target = tmp_path / 'elsewhere'
+    target.mkdir()
+    (target / 'keep.mp3').write_bytes(b'\x00')
+    (tmp_path / 'podcasts').mkdir()
+    os.symlink(target, tmp_path / 'podcasts' / 'linked')
+
+    background_module.run_cleanup()
+
+    assert (target / 'keep.mp3').exists()
+    assert os.path.islink(tmp_path / 'podcasts' / 'linked')
+
+
+def test_single_orphan_removed_inline(tmp_path):
+    _make_podcast_dirs(tmp_path, ['gone'])
+    with os.scandir(tmp_path / 'podcasts') as entries:
+        orphans = list(entries)
+
+    background_module._remove_orphan_dirs(orphans)
+
+    assert os.listdir(tmp_path / 'podcasts') == []
+
+
+class _RecordingPool:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn):
+        self.submitted.append(fn)
+        return Future()  # never completes: the rebuild is still running
+
+
+def test_index_rebuild_handed_off_and_not_stacked(tmp_path, monkeypatch, cleanup_env):
+    (tmp_path / 'podcasts').mkdir()
+    pool = _RecordingPool()
+    monkeypatch.setattr(background_module, '_maintenance_pool', pool)
+    monkeypatch.setattr(background_module, '_index_rebuild', None)
+    monkeypatch.setattr(background_module.run_cleanup, '_last_index_rebuild',
+                        0, raising=False)
+
+    background_module.run_cleanup()
+    background_module.run_cleanup()
+
+    assert pool.submitted == [background_module._rebuild_search_index]
+    cleanup_env.rebuild_search_index.assert_not_called()
+
+
+def test_failed_rebuild_is_not_stamped(monkeypatch):
+    fake_db = MagicMock()
+    fake_db.rebuild_search_index.side_effect = RuntimeError('fts busy')
+    monkeypatch.setattr(background_module, 'db', fake_db)
+    monkeypatch.setattr(background_module.run_cleanup, '_last_index_rebuild',
+                        0, raising=False)
+
+    background_module._rebuild_search_index()
+
+    assert background_module.run_cleanup._last_index_rebuild == 0
+    fake_db.clear_leaked_transaction.assert_called_once()
+
+
+def _age(path, seconds):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_stale_renders_removed_outside_current_job(tmp_path, monkeypatch, cleanup_env):
+    import processing_queue
+    _make_podcast_dirs(tmp_path, ['idle', 'busy'])
+    cleanup_env.get_podcast_feed_urls.return_value = [{'slug': 'idle'}, {'slug': 'busy'}]
+    idle_eps = tmp_path / 'podcasts' / 'idle' / 'episodes'
+    busy_eps = tmp_path / 'podcasts' / 'busy' / 'episodes'
+    stale = idle_eps / '.render-abc.mp3'
+    fresh = idle_eps / '.render-new.mp3'
+    in_use = busy_eps / '.render-live.mp3'
+    for path in (stale, fresh, in_use):
+        path.write_bytes(b'\x00' * 16)
+    _age(stale, 2 * 3600)
+    _age(in_use, 2 * 3600)
+    _age(idle_eps / 'ep.mp3', 2 * 3600)
+
+    queue = MagicMock()
+    queue.get_current.return_value = ('busy', 'ep1')
+    monkeypatch.setattr(processing_queue, 'ProcessingQueue', lambda: queue)
+
+    background_module.run_cleanup()
+
+    assert not stale.exists()
+    assert fresh.exists()       # younger than the age floor
+    assert in_use.exists()      # the running job's feed is skipped
+    assert (idle_eps / 'ep.mp3').exists()
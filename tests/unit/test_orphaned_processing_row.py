@@ -62,6 +62,7 @@ class TestWaiterOrphanDetection:
         mock_db.claim_next_queued_episode.side_effect = [queue_row, None]
         mock_db.is_auto_process_enabled_for_podcast.return_value = True
         mock_db.get_episode.return_value = episode
+        mock_db.get_episode_status.return_value = episode_status
 
         stop_after = {'n': 0}
 
@@ -75,6 +76,8 @@ class TestWaiterOrphanDetection:
              patch('processing_queue.ProcessingQueue', return_value=mock_queue), \
              patch('main_app.processing.start_background_processing',
                    return_value=(True, 'started')), \
+             patch('main_app.processing.wait_for_background_job',
+                   side_effect=fake_wait), \
              patch('processing_timeouts.get_hard_timeout', return_value=7200), \
              patch.object(background, 'refresh_logger') as log, \
              patch('offline_queue.offline_queue_tick'):
@@ -130,33 +133,116 @@ class TestWaiterOrphanDetection:
         warnings = ' '.join(str(c) for c in log.warning.call_args_list)
         assert 'says processing' not in warnings
 
+    def test_a_finished_job_is_picked_up_on_its_first_wake(self):
+        """The worker signals on exit, so the waiter reads the row once."""
+        log, mock_db = self._drain_once(queue_says_processing=False,
+                                        episode_status='processed')
+
+        statuses = [call.args[1] for call in mock_db.update_queue_status.call_args_list]
+        assert statuses == ['completed']
+        # One status-only poll inside the waiter, then the full final read.
+        assert mock_db.get_episode_status.call_count == 1
+        assert mock_db.get_episode.call_count == 1
+
+
+class TestJobFinishedSignal:
+    def test_wait_returns_once_the_job_thread_exits(self):
+        from main_app import processing
+
+        processing._job_finished.clear()
+        assert processing.wait_for_background_job(timeout=0) is False
+        processing._job_finished.set()
+        assert processing.wait_for_background_job(timeout=0) is True
+
+    def test_a_late_signal_does_not_finish_the_next_job(self):
+        """The next job can take the queue between the old job's release and
+        its signal; that signal must not mark the new job as done."""
+        from main_app import processing
+
+        queue = MagicMock()
+        queue.is_processing.return_value = False
+        queue.acquire.return_value = True
+
+        def start_next_job():
+            # Runs inside the old job's finally, after release().
+            with patch('threading.Thread'):
+                processing.start_background_processing(
+                    'example-podcast', 'next0000next', 'https://e.test/b.mp3',
+                    'Episode Two', 'Example Podcast', None, None)
+
+        queue.release.side_effect = start_next_job
+        first_done = processing.threading.Event()
+        processing._job_finished = first_done
+
+        with patch('processing_queue.ProcessingQueue', return_value=queue), \
+             patch.object(processing, 'process_episode'), \
+             patch.object(processing, 'status_service'), \
+             patch.object(processing, 'db'):
+            processing._process_episode_background(
+                'example-podcast', 'a1b2c3d4e5f6', 'https://e.test/a.mp3',
+                'Episode One', 'Example Podcast', None, None,
+                job_finished=first_done)
+
+        processing._cancel_events.pop('example-podcast:next0000next', None)
+        assert first_done.is_set()
+        assert processing.wait_for_background_job(timeout=0) is False
+
 
 class TestSweepIsLockAware:
     """Age alone cannot tell a slow pass from a crash; the lock can."""
 
-    def _sweep(self, lock_held):
+    _ROW = (1, 'a1b2c3d4e5f6', 0, 'example-podcast')
+
+    def _sweep(self, rows=(_ROW,), lock_held=False):
+        """Run the sweep over ``rows`` and return (conn, mock_db, log)."""
         conn = MagicMock()
-        conn.execute.return_value.fetchall.return_value = [
-            {'id': 1, 'episode_id': 'a1b2c3d4e5f6', 'retry_count': 0,
-             'slug': 'example-podcast'}
-        ]
+        conn.execute.return_value = iter(rows)
         mock_db = MagicMock()
         mock_db.get_connection.return_value = conn
+        mock_db.transaction.return_value.__enter__.return_value = conn
         queue = MagicMock()
         queue.get_current.return_value = (
             ('example-podcast', 'a1b2c3d4e5f6') if lock_held else None)
 
         with patch.object(background, 'db', mock_db), \
+             patch.object(background, 'refresh_logger') as log, \
              patch('processing_queue.ProcessingQueue', return_value=queue):
             background.reset_stuck_processing_episodes()
 
-        return [c for c in conn.execute.call_args_list if 'UPDATE' in str(c)]
+        return conn, mock_db, log
 
     def test_a_row_whose_episode_holds_the_lock_is_left_alone(self):
-        assert self._sweep(lock_held=True) == []
+        conn, _, _ = self._sweep(lock_held=True)
+        conn.executemany.assert_not_called()
 
     def test_a_row_with_no_worker_on_it_is_still_reset(self):
-        assert self._sweep(lock_held=False)
+        conn, _, _ = self._sweep(lock_held=False)
+        assert [c for c in conn.executemany.call_args_list if 'UPDATE' in str(c)]
+
+    def test_sweep_batches_updates_per_outcome(self):
+        """One UPDATE per outcome, not per row, however many rows a crash strands."""
+        conn, mock_db, _ = self._sweep([
+            (i, f'ep{i}', rc, 'example-podcast')
+            for i, rc in ((1, 0), (2, 99), (3, None), (4, 99))
+        ])
+
+        batches = {('permanently_failed' in c.args[0]): c.args[1]
+                   for c in conn.executemany.call_args_list}
+        assert batches == {True: [(2,), (4,)], False: [(1,), (3,)]}
+        mock_db.transaction.assert_called_once_with(immediate=True)
+
+    def test_sweep_logs_one_line_per_outcome(self):
+        _, _, log = self._sweep(
+            [(i, f'ep{i}', 0, 'example-podcast') for i in range(60)]
+            + [(99, 'ep99', 99, 'example-podcast')]
+        )
+
+        assert log.info.call_count == 1
+        assert log.warning.call_count == 1
+        reset_line = log.info.call_args.args[0]
+        assert reset_line.startswith('Reset 60 stuck episode(s)')
+        assert reset_line.endswith('... and 10 more')
+        assert 'example-podcast/ep99' in log.warning.call_args.args[0]
 
 
 def test_finalize_clears_a_stale_crash_message():
@@ -172,3 +258,24 @@ def test_finalize_clears_a_stale_crash_message():
             'example-podcast', 'a1b2c3d4e5f6', 2, 1, 1, 100.0, 90.0, 1)
 
     assert mock_db.upsert_episode.call_args.kwargs['error_message'] is None
+
+
+def test_sweep_against_real_database(temp_db):
+    """The streamed SELECT must be fully closed before BEGIN IMMEDIATE."""
+    temp_db.create_podcast('sweep-feed', 'https://example.com/s.xml', 'Sweep Feed')
+    for episode_id, retries in (('aaaaaaaaaaaa', 0), ('bbbbbbbbbbbb', 99)):
+        temp_db.upsert_episode(slug='sweep-feed', episode_id=episode_id,
+                               title='ep', original_url='https://example.com/a.mp3',
+                               status='processing', retry_count=retries)
+    conn = temp_db.get_connection()
+    conn.execute("UPDATE episodes SET updated_at = '2000-01-01T00:00:00Z'")
+    conn.commit()
+    queue = MagicMock()
+    queue.get_current.return_value = None
+
+    with patch.object(background, 'db', temp_db), \
+         patch('processing_queue.ProcessingQueue', return_value=queue):
+        background.reset_stuck_processing_episodes()
+
+    assert temp_db.get_episode_status('sweep-feed', 'aaaaaaaaaaaa') == 'pending'
+    assert temp_db.get_episode_status('sweep-feed', 'bbbbbbbbbbbb') == 'permanently_failed'
@@ -0,0 +1,49 @@
+"""parse_transcript_segments: one regex pass over the transcript text."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from utils.text import parse_transcript_segments
+
+
+def test_parses_timestamped_lines():
+    text = (
+        "[00:00:00.000 --> 00:00:04.500] Welcome to the show\n"
+        "[01:02:03.250 --> 01:02:07.000] Brought to you by Example\n"
+    )
+
+    assert parse_transcript_segments(text) == [
+        {'start': 0.0, 'end': 4.5, 'text': 'Welcome to the show'},
+        {'start': 3723.25, 'end': 3727.0, 'text': 'Brought to you by Example'},
+    ]
+
+
+def test_non_canonical_timestamps_fall_back_to_parse_timestamp():
+    text = "[1:02 --> 01:02:03,5] comma decimal and M:SS"
+
+    assert parse_transcript_segments(text) == [
+        {'start': 62.0, 'end': 3723.5, 'text': 'comma decimal and M:SS'},
+    ]
+
+
+def test_skips_malformed_and_unbracketed_lines():
+    text = (
+        "WEBVTT\n"
+        "\n"
+        " [00:00:01.000 --> 00:00:02.000] leading space\n"
+        "[00:00:01.000 --> 00:00:02.000]no space after bracket\n"
+        "[garbage --> 00:00:02.000] bad start\n"
+        "[00:00:01.000 --> 00:00:02.000 --> 00:00:03.000] two arrows\n"
+        "[00:00:05.000 --> 00:00:06.000] kept ] with bracket\n"
+    )
+
+    assert parse_transcript_segments(text) == [
+        {'start': 5.0, 'end': 6.0, 'text': 'kept ] with bracket'},
+    ]
+
+
+def test_empty_text_after_range_is_kept():
+    assert parse_transcript_segments("[00:00:01.000 --> 00:00:02.000] ") == [
+        {'start': 1.0, 'end': 2.0, 'text': ''},
+    ]
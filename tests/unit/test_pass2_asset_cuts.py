@@ -40,3 +40,23 @@ def test_pass2_rendered_cuts_carry_replacement_duration(monkeypatch):
     out = processing._pass2_cuts_in_original(recut, pass1)
     assert out == [{'start': 249.0, 'end': 279.0, 'detection_stage': 'verification',
                      'replacement_duration': 30.0}]
+
+
+def test_recut_replaces_pass1_output_in_place(tmp_path):
+    """The recut render is renamed over the pass-1 file; no second path."""
+    from unittest.mock import MagicMock
+
+    processed = tmp_path / 'pass1.mp3'
+    processed.write_bytes(b'pass1')
+    recut = tmp_path / 'recut.mp3'
+    recut.write_bytes(b'recut')
+    applied = [{'start': 5.0, 'end': 10.0}]
+    audio = MagicMock()
+    audio.process_episode.return_value = (str(recut), applied)
+
+    path, recut_applied, ok = processing._recut_processed_audio(
+        'slug', 'ep', str(processed), [{'start': 5.0, 'end': 10.0}], audio)
+
+    assert (path, recut_applied, ok) == (str(processed), applied, True)
+    assert processed.read_bytes() == b'recut'
+    assert not recut.exists()
@@ -48,3 +48,13 @@ def test_valid_slug_special_case_unchanged(storage):
     """Legitimate slugs that resemble reserved prefixes still resolve."""
     valid = storage.get_podcast_dir("regular-podcast-slug")
     assert valid.exists()
+
+
+def test_delete_original_rss_removes_the_saved_upstream(storage):
+    storage.save_original_rss("a-pod", "<rss>old source</rss>")
+
+    assert storage.delete_original_rss("a-pod") is True
+    assert storage.get_original_rss("a-pod") is None
+    assert storage.delete_original_rss("a-pod") is False
+    with pytest.raises(PathContainmentError):
+        storage.delete_original_rss("../escape")
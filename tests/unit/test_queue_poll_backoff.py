@@ -0,0 +1,77 @@
+"""The queue drainer backs off with jitter only while the lock is busy.
+
+An empty queue is re-polled on a fixed QUEUE_POLL_BASE_SECONDS so a newly
+queued episode is picked up promptly; busy claims back off via
+calculate_backoff and reset once an episode starts.
+"""
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from tests.app_bootstrap import bootstrap
+
+_test_data_dir = bootstrap('queue_backoff_test_')
+
+from main_app import background
+from utils.retry import calculate_backoff
+
+
+def _run(claims, start_return=(False, 'busy')):
+    """Drain ``claims`` (None = empty queue) and return the backoff calls."""
+    waits = []
+    mock_db = MagicMock()
+    mock_db.claim_next_queued_episode.side_effect = claims
+    mock_db.get_podcast_by_slug.return_value = {}
+    mock_db.is_auto_process_enabled_for_podcast.return_value = True
+    mock_db.get_episode_status.return_value = 'processed'
+
+    with patch.object(background, 'db', mock_db), \
+         patch.object(background, 'shutdown_event') as ev, \
+         patch.object(background, 'calculate_backoff', wraps=calculate_backoff) as backoff, \
+         patch('main_app.processing.start_background_processing',
+               return_value=start_return), \
+         patch('main_app.processing.wait_for_background_job'), \
+         patch('offline_queue.offline_queue_tick'):
+        ev.is_set.side_effect = lambda: len(waits) >= len(claims)
+        ev.wait.side_effect = lambda timeout=None: waits.append(timeout)
+        background.background_queue_processor()
+
+    return backoff, waits
+
+
+def _queue_row():
+    return {
+        'id': 7, 'podcast_slug': 'example-podcast',
+        'episode_id': 'a1b2c3d4e5f6', 'original_url': 'https://e.test/a.mp3',
+        'title': 'Episode One', 'podcast_title': 'Example Podcast',
+        'published_at': None, 'description': None,
+    }
+
+
+def test_idle_wait_is_fixed():
+    backoff, waits = _run([None, None, None, None])
+
+    backoff.assert_not_called()
+    assert waits == [background.QUEUE_POLL_BASE_SECONDS] * 4
+
+
+def test_busy_backoff_does_not_stretch_idle_wait():
+    backoff, waits = _run([_queue_row(), _queue_row(), None])
+
+    assert [c.args[0] for c in backoff.call_args_list] == [0, 1]
+    assert backoff.call_args_list[0].kwargs['max_delay'] == background.QUEUE_BUSY_POLL_MAX_SECONDS
+    assert waits[-1] == background.QUEUE_POLL_BASE_SECONDS
+
+
+def test_busy_queue_backs_off_across_claims():
+    backoff, _ = _run([_queue_row(), _queue_row(), _queue_row()])
+
+    assert [c.args[0] for c in backoff.call_args_list] == [0, 1, 2]
+
+
+def test_successful_start_resets_busy_backoff():
+    backoff, _ = _run([_queue_row(), _queue_row()], start_return=(True, None))
+
+    backoff.assert_not_called()
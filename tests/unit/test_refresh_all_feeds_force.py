@@ -55,6 +55,66 @@ class TestRefreshAllFeedsForce(unittest.TestCase):
             self.assertEqual(args[2], True)
 
 
+class TestRefreshAllFeedsHostCap(unittest.TestCase):
+    """Feeds on one host never refresh more than FEED_REFRESH_MAX_PER_HOST
+    at a time, while other hosts proceed."""
+
+    @patch('main_app.feeds.FEED_REFRESH_MAX_WORKERS', 2)
+    @patch('main_app.feeds.FEED_REFRESH_MAX_PER_HOST', 1)
+    @patch('main_app.feeds.refresh_rss_feed')
+    @patch('main_app.feeds.get_feed_map')
+    def test_same_host_feeds_do_not_overlap(self, get_feed_map, refresh_rss_feed):
+        import threading
+        import time
+
+        # The shared host's feeds come first, as they do when a user has
+        # subscribed to many shows from one publisher.
+        get_feed_map.return_value = {
+            f'pod-{i}': {'in': f'https://Feeds.Example.com/{i}.rss'} for i in range(4)
+        }
+        get_feed_map.return_value['other'] = {'in': 'https://other.example.net/x.rss'}
+        lock = threading.Lock()
+        active = {}
+        peak = {}
+        started = []
+
+        def _fake(slug, feed_url, force):
+            host = 'other' if slug == 'other' else 'shared'
+            with lock:
+                started.append(slug)
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+
+        refresh_rss_feed.side_effect = _fake
+
+        refresh_all_feeds()
+
+        self.assertEqual(refresh_rss_feed.call_count, 5)
+        self.assertEqual(peak['shared'], 1)
+        # The other host starts alongside the first shared feed rather than
+        # queueing behind the shared host's backlog.
+        self.assertIn('other', started[:2])
+
+    @patch('main_app.feeds.refresh_rss_feed')
+    @patch('main_app.feeds.get_feed_map')
+    def test_malformed_url_does_not_abort_the_pass(self, get_feed_map, refresh_rss_feed):
+        """urlsplit raises on a bad stored URL; that row must fail on its own."""
+        get_feed_map.return_value = {
+            'pod-a': {'in': 'https://example.com/a.rss'},
+            'broken': {'in': 'http://[::1'},
+            'pod-b': {'in': 'https://other.example.net/b.rss'},
+        }
+        refresh_rss_feed.return_value = True
+
+        refresh_all_feeds()
+
+        refreshed = {call.args[0] for call in refresh_rss_feed.call_args_list}
+        self.assertEqual(refreshed, {'pod-a', 'broken', 'pod-b'})
+
+
 class TestRefreshRSSFeedCoalesceBypass(unittest.TestCase):
     """Regression: force=True must bypass the 30s _refresh_coalesce gate."""
 
@@ -0,0 +1,36 @@
+"""Tests for the feed-route access log decorator."""
+import logging
+from unittest.mock import patch
+
+from flask import Flask
+
+from tests.app_bootstrap import bootstrap
+
+bootstrap('request_logging_test_')
+from main_app import routes
+
+
+def _call(level):
+    app = Flask(__name__)
+    view = routes.log_request_detailed(lambda: app.response_class('ok'))
+    with app.test_request_context('/a-show', headers={'User-Agent': 'x' * 150}), \
+            patch.object(routes.feed_logger, 'level', level), \
+            patch.object(routes, 'client_ip', return_value='203.0.113.9') as ip, \
+            patch.object(routes.feed_logger, 'info') as info:
+        routes.feed_logger.manager._clear_cache()
+        view()
+    routes.feed_logger.manager._clear_cache()
+    return ip, info
+
+
+def test_access_line_truncates_user_agent():
+    ip, info = _call(logging.INFO)
+    line = info.call_args.args[0]
+    assert line.startswith('GET /a-show 200 ')
+    assert f"[{'x' * 100}]" in line and 'x' * 101 not in line
+
+
+def test_disabled_info_skips_ip_and_user_agent():
+    ip, info = _call(logging.WARNING)
+    ip.assert_not_called()
+    info.assert_not_called()
@@ -0,0 +1,23 @@
+"""Tests for the cached last_checked parse used by serve_rss."""
+from datetime import datetime, timezone
+
+import pytest
+
+from main_app.routes import _last_checked_epoch
+
+
+def test_z_suffix_parses_to_utc_epoch():
+    expected = datetime(2026, 3, 15, 12, 0, tzinfo=timezone.utc).timestamp()
+    assert _last_checked_epoch('2026-03-15T12:00:00Z') == expected
+
+
+def test_offset_timestamp_is_normalized():
+    assert (_last_checked_epoch('2026-03-15T14:00:00+02:00')
+            == _last_checked_epoch('2026-03-15T12:00:00Z'))
+
+
+@pytest.mark.parametrize('value', ['not-a-date', '2026-03-15T12:00:00'])
+def test_unusable_value_raises(value):
+    # serve_rss treats ValueError/TypeError as stale and refreshes
+    with pytest.raises((ValueError, TypeError)):
+        _last_checked_epoch(value)
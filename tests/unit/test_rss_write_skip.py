@@ -0,0 +1,21 @@
+"""Tests for skipping unchanged feed XML writes in Storage."""
+from tests.app_bootstrap import bootstrap
+
+bootstrap('rss_write_skip_test_')
+from storage import Storage
+
+
+def test_identical_content_is_not_rewritten(tmp_path):
+    path = tmp_path / 'modified-rss.xml'
+    assert Storage._write_text_if_changed(path, '<rss>a</rss>\r\n') is True
+    inode = path.stat().st_ino
+    assert Storage._write_text_if_changed(path, '<rss>a</rss>\r\n') is False
+    assert path.stat().st_ino == inode
+
+
+def test_changed_content_is_replaced(tmp_path):
+    path = tmp_path / 'modified-rss.xml'
+    Storage._write_text_if_changed(path, '<rss>a</rss>')
+    assert Storage._write_text_if_changed(path, '<rss>b</rss>') is True
+    assert path.read_text() == '<rss>b</rss>'
+    assert [p.name for p in tmp_path.iterdir()] == ['modified-rss.xml']
@@ -111,3 +111,86 @@ def test_rebuild_auth_keeps_api_key_on_same_host_redirect():
     session.rebuild_auth(redirected, response)
 
     assert redirected.headers.get('x-api-key') == 'secret'
+
+
+def test_safe_get_pooled_reuses_session_across_threads():
+    """Each refresh cycle runs on fresh worker threads; the keep-alive session
+    has to outlive them or no connection is reused between cycles."""
+    import threading
+
+    seen = []
+
+    def fake_get(self, url, **kwargs):
+        seen.append(self)
+        return MagicMock()
+
+    with patch('utils.safe_http._RevalidatingSession.get', fake_get):
+        safe_get('https://feeds.example.com/a.xml', URLTrust.OPERATOR_CONFIGURED,
+                 stream=True, pooled=True)
+        worker = threading.Thread(target=lambda: safe_get(
+            'https://feeds.example.com/b.xml', URLTrust.OPERATOR_CONFIGURED,
+            stream=True, pooled=True))
+        worker.start()
+        worker.join()
+        safe_get('https://feeds.example.com/c.xml', URLTrust.OPERATOR_CONFIGURED,
+                 max_redirects=1, stream=True, pooled=True)
+
+    assert seen[0] is seen[1]
+    assert seen[2] is not seen[0]
+
+
+def test_close_pooled_sessions_closes_and_forgets_them():
+    from utils.safe_http import _pooled_session, close_pooled_sessions
+
+    session = _pooled_session(URLTrust.OPERATOR_CONFIGURED, 3)
+    with patch.object(session, 'close') as close:
+        close_pooled_sessions()
+
+    close.assert_called_once()
+    assert _pooled_session(URLTrust.OPERATOR_CONFIGURED, 3) is not session
+
+
+def test_pooled_session_refuses_cookies():
+    """A pooled session must not carry one feed host's cookies to the next."""
+    from email.message import Message
+
+    import requests
+    from requests.cookies import extract_cookies_to_jar
+    from utils.safe_http import _pooled_session
+
+    session = _pooled_session(URLTrust.OPERATOR_CONFIGURED, 3)
+    request = requests.Request('GET', 'https://feeds.example.com/a.xml').prepare()
+    headers = Message()
+    headers['Set-Cookie'] = 'sid=abc; Path=/'
+    raw = MagicMock()
+    raw._original_response.msg = headers
+    extract_cookies_to_jar(session.cookies, request, raw)
+
+    assert len(session.cookies) == 0
+
+
+def test_conditional_fetches_from_separate_refresh_cycles_share_a_session():
+    """refresh_all_feeds builds a new executor per cycle; the second cycle's
+    conditional GET must still land on the first cycle's session."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rss_parser import RSSParser
+
+    seen = []
+
+    def fake_get(self, url, **kwargs):
+        seen.append(self)
+        response = MagicMock()
+        response.status_code = 304
+        return response
+
+    parser = RSSParser()
+    with patch('utils.safe_http._RevalidatingSession.get', fake_get), \
+         patch('rss_parser._feed_trust', return_value=URLTrust.OPERATOR_CONFIGURED):
+        for _ in range(2):
+            with ThreadPoolExecutor(max_workers=1) as cycle:
+                cycle.submit(parser.fetch_feed_conditional,
+                             'https://feeds.example.com/a.xml', etag='"v1"').result()
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
@@ -80,7 +80,7 @@ def _run_recut(ads_to_remove, all_ads, segment_actions, podcast_id=1):
         local_ap = local_ap_cls.return_value
         local_ap.get_audio_duration.return_value = 60.0
         local_ap.process_episode.side_effect = (
-            lambda work_path, segs: (
+            lambda work_path, segs, output_dir=None: (
                 '/tmp/segrerender-cut.mp3',
                 [{'start': s['start'], 'end': s['end']} for s in segs]))
 
@@ -89,6 +89,8 @@ def _run_recut(ads_to_remove, all_ads, segment_actions, podcast_id=1):
             time.time(), cancel_event=None)
 
         assert result is True
+        # Rendered beside the final file so the finalize move is a rename.
+        assert local_ap.process_episode.call_args.kwargs['output_dir'] == '/tmp'
         audio_segments = local_ap.process_episode.call_args.args[1]
         saved_markers = storage.save_combined_ads.call_args.args[2]
 
@@ -0,0 +1,43 @@
+"""VTT and chapters responses carry an ETag and honor If-None-Match."""
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from tests.app_bootstrap import bootstrap
+
+_test_data_dir = bootstrap('pc20_etag_test_')
+from main_app import app
+
+VTT = 'WEBVTT\n\n00:00:00.000 --> 00:00:05.000\nHello\n'
+CHAPTERS = {'version': '1.2.0', 'chapters': [{'startTime': 0, 'title': 'Intro'}]}
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as c:
+        yield c
+
+
+@pytest.mark.parametrize('url, getter, body', [
+    ('/episodes/test-pod/abc123def456.vtt', 'get_transcript_vtt', VTT),
+    ('/episodes/test-pod/abc123def456/chapters.json', 'get_chapters_json', CHAPTERS),
+])
+@patch('main_app.routes.storage')
+def test_revalidates_with_etag(mock_storage, client, url, getter, body):
+    getattr(mock_storage, getter).return_value = body
+    headers = {'Accept-Encoding': 'identity'}
+
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+
+    resp = client.get(url, headers={**headers, 'If-None-Match': etag})
+    assert resp.status_code == 304
+    assert resp.get_data() == b''
+    assert resp.headers['Access-Control-Allow-Origin'] == '*'
+
+
+def teardown_module():
+    shutil.rmtree(_test_data_dir, ignore_errors=True)
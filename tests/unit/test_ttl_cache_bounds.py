@@ -51,6 +51,24 @@ def test_main_app_overwrite_at_cap_does_not_evict():
     assert cache.get('b') == 22
 
 
+def test_main_app_overwrite_refreshes_eviction_order():
+    cache = MainAppTTLCache(ttl_seconds=60, max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 11)
+    cache.set('c', 3)
+    assert cache.get('a') == 11
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_main_app_ignores_wall_clock_jumps(monkeypatch):
+    cache = MainAppTTLCache(ttl_seconds=60)
+    cache.set('k', 'v')
+    monkeypatch.setattr(time, 'time', lambda: 10 ** 10)
+    assert cache.get('k') == 'v'
+
+
 def test_main_app_default_construction_unchanged():
     cache = MainAppTTLCache()
     cache.set('k', 'v')